@@ -0,0 +1,42 @@
+"""Benchmark of ivy.Array construction when wrapping native arrays.
+
+Reports the time and the peak traced memory for wrapping many small native arrays
+with ivy.Array on the numpy backend.
+
+Usage: python benchmarks/bench_array.py [num_arrays]
+"""
+
+# global
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# local
+import ivy
+
+
+def main(num_arrays=1000000):
+    ivy.set_backend("numpy")
+    natives = [np.array([float(i)]) for i in range(1000)]
+    num_rounds = num_arrays // len(natives)
+    start = time.perf_counter()
+    for _ in range(num_rounds):
+        for x in natives:
+            ivy.Array(x)
+    duration = time.perf_counter() - start
+    print(
+        "wrapped {} arrays in {:.2f}s ({:.2f} us/array)".format(
+            num_rounds * len(natives), duration, duration / num_arrays * 1e6
+        )
+    )
+    tracemalloc.start()
+    wrapped = [ivy.Array(x) for x in natives]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("peak memory per wrapped array: {:.0f} bytes".format(peak / len(wrapped)))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
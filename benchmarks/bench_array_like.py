@@ -0,0 +1,38 @@
+"""Benchmark of the functions decorated with handle_array_like_without_promotion.
+
+Times the manipulation and statistical functions which carry the decorator, when
+called with array-like (list) inputs on the numpy backend.
+
+Usage: python benchmarks/bench_array_like.py
+"""
+
+# global
+import io
+import timeit
+from contextlib import redirect_stdout
+
+# local
+import ivy
+from ivy.functional.ivy import manipulation, statistical
+
+
+def main(number=2000):
+    ivy.set_backend("numpy")
+    x = [[1.0, 2.0], [3.0, 4.0]]
+    for module in [manipulation, statistical]:
+        for name, fn in sorted(module.__dict__.items()):
+            if not hasattr(fn, "handle_array_like_without_promotion"):
+                continue
+            try:
+                with redirect_stdout(io.StringIO()):
+                    ivy.__dict__[name](x)
+            except Exception:
+                # requires additional arguments
+                continue
+            t = timeit.timeit(lambda: ivy.__dict__[name](x), number=number) / number
+            print("{:<20}: {:8.2f} us/call".format(name, t * 1e6))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main()
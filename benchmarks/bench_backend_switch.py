@@ -0,0 +1,41 @@
+"""Benchmark of switching the global backend.
+
+Times repeated switches between two backends with ivy.set_backend and
+ivy.unset_backend, as done by ContextManager in a loop.
+
+Usage: python benchmarks/bench_backend_switch.py [num_switches] [backend] [backend]
+"""
+
+# global
+import sys
+import time
+
+# local
+from ivy.backend_handler import ContextManager
+
+
+def main(num_switches=1000, first_backend="numpy", second_backend="torch"):
+    num_switches = int(num_switches)
+    backends = [first_backend, second_backend]
+    # the first switches wrap the namespaces of both backends
+    for backend in backends:
+        with ContextManager(backend):
+            pass
+    start = time.perf_counter()
+    for i in range(num_switches):
+        with ContextManager(backends[i % 2]):
+            pass
+    duration = time.perf_counter() - start
+    print(
+        "{} switches between {} and {}: {:.3f}s ({:.1f} us/switch)".format(
+            num_switches,
+            first_backend,
+            second_backend,
+            duration,
+            duration / num_switches * 1e6,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,49 @@
+"""Benchmark of loading containers from hdf5 files.
+
+Reports the time and the peak traced memory for loading a container of large
+datasets with Container.cont_from_disk_as_hdf5 on the numpy backend, both reading
+the datasets and memory-mapping them.
+
+Usage: python benchmarks/bench_container_hdf5.py [num_rows] [num_leaves]
+"""
+
+# global
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import h5py
+import numpy as np
+
+# local
+import ivy
+
+
+def main(num_rows=1000000, num_leaves=4):
+    ivy.set_backend("numpy")
+    filepath = os.path.join(tempfile.mkdtemp(), "bench.hdf5")
+    with h5py.File(filepath, "w") as h5_obj:
+        for i in range(num_leaves):
+            h5_obj.create_dataset(
+                "leaf_{}".format(i), data=np.random.rand(num_rows, 8).astype("float32")
+            )
+    file_size, _ = ivy.Container.h5_file_size(filepath)
+    for memory_map in [False, True]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        ivy.Container.cont_from_disk_as_hdf5(filepath, memory_map=memory_map)
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            "memory_map={}: loaded {:.0f} MB in {:.3f}s, peak memory {:.2f}x".format(
+                memory_map, file_size / 1e6, duration, peak / file_size
+            )
+        )
+    os.remove(filepath)
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+"""Benchmark of mapping ivy functions over containers on the numpy backend.
+
+Reports the time per call of ivy.add and ivy.clip on two containers with an
+increasing number of leaves. These go through
+ivy.Container.cont_multi_map_in_function, which substitutes the leaves of the
+containers into the flattened arguments. For comparison, it also reports the time of
+calling the same functions directly on each pair of leaves.
+
+Usage: python benchmarks/bench_container_map.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+
+
+def _container(num_leaves):
+    return ivy.Container(
+        {"layer_{}".format(i): ivy.array(np.ones((4, 4))) for i in range(num_leaves)}
+    )
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e3
+
+
+def main(num_calls=20):
+    ivy.set_backend("numpy")
+    for num_leaves in [10, 100, 500]:
+        c1, c2 = _container(num_leaves), _container(num_leaves)
+        leaves1, leaves2 = list(c1.values()), list(c2.values())
+        fns = {
+            "ivy.add": lambda: ivy.add(c1, c2),
+            "leafwise ivy.add": lambda: [
+                ivy.add(x, y) for x, y in zip(leaves1, leaves2)
+            ],
+            "ivy.clip": lambda: ivy.clip(c1, 0.0, c2),
+            "leafwise ivy.clip": lambda: [
+                ivy.clip(x, 0.0, y) for x, y in zip(leaves1, leaves2)
+            ],
+        }
+        results = [(name, _time(fn, num_calls)) for name, fn in fns.items()]
+        print(
+            "{} leaves: ".format(num_leaves)
+            + ", ".join("{} {:.2f} ms".format(name, t) for name, t in results)
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
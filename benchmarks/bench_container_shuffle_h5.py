@@ -0,0 +1,59 @@
+"""Benchmark of shuffling hdf5 files on disk.
+
+Reports the time for shuffling a file of aligned datasets with
+Container.shuffle_h5_file, in place, to a new file, and virtually, together with
+the time for loading the virtually shuffled file.
+
+Usage: python benchmarks/bench_container_shuffle_h5.py [num_rows] [block_size]
+"""
+
+# global
+import os
+import sys
+import tempfile
+import time
+import h5py
+import numpy as np
+
+# local
+import ivy
+
+
+def _write_file(filepath, num_rows):
+    with h5py.File(filepath, "w") as h5_obj:
+        x = np.random.rand(num_rows, 16).astype("float32")
+        h5_obj.create_dataset("x", data=x, maxshape=(None, 16))
+        h5_obj.create_group("y").create_dataset(
+            "labels", data=np.arange(num_rows), maxshape=(None,)
+        )
+
+
+def main(num_rows=1000000, block_size=None):
+    ivy.set_backend("numpy")
+    directory = tempfile.mkdtemp()
+    filepath = os.path.join(directory, "bench.hdf5")
+    out_filepath = os.path.join(directory, "bench_shuffled.hdf5")
+    for mode in ["in_place", "out", "virtual"]:
+        _write_file(filepath, num_rows)
+        start = time.perf_counter()
+        ivy.Container.shuffle_h5_file(
+            filepath,
+            block_size=block_size,
+            out=out_filepath if mode == "out" else None,
+            virtual=mode == "virtual",
+        )
+        print(
+            "{}: shuffled {} rows in {:.2f}s".format(
+                mode, num_rows, time.perf_counter() - start
+            )
+        )
+    start = time.perf_counter()
+    ivy.Container.cont_from_disk_as_hdf5(filepath)
+    print("virtual: loaded in {:.2f}s".format(time.perf_counter() - start))
+    os.remove(filepath)
+    os.remove(out_filepath)
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
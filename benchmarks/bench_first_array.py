@@ -0,0 +1,64 @@
+"""Benchmark of first-array discovery on the numpy backend.
+
+Reports the time per call of ivy.func_wrapper._get_first_array, which drives dtype
+and device inference, and of ivy.current_backend, on keyword arguments holding a
+deeply nested config of python scalars before the array. The array search through
+ivy.nested_argwhere and ivy.index_nest, which _get_first_array used before, is
+reported for comparison.
+
+Usage: python benchmarks/bench_first_array.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+from ivy.func_wrapper import _get_first_array
+
+
+def _kwargs(depth):
+    config = {"lr": 1e-3, "betas": (0.9, 0.999)}
+    for i in range(depth):
+        config = {"level_{}".format(i): config, "scale": float(i), "ids": [i] * 4}
+    return {"config": config, "x": ivy.array(np.ones((4, 4)))}
+
+
+def _argwhere_first_array(**kwargs):
+    arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
+    return ivy.index_nest(kwargs, arr_idxs[0]) if arr_idxs else None
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e6
+
+
+def main(num_calls=200):
+    ivy.set_backend("numpy")
+    for depth in [1, 10, 100]:
+        kwargs = _kwargs(depth)
+        fns = {
+            "_get_first_array": lambda: _get_first_array(**kwargs),
+            "argwhere": lambda: _argwhere_first_array(**kwargs),
+        }
+        results = [(name, _time(fn, num_calls)) for name, fn in fns.items()]
+        ivy.unset_backend()
+        results.append(
+            ("current_backend", _time(lambda: ivy.current_backend(**kwargs), num_calls))
+        )
+        ivy.set_backend("numpy")
+        print(
+            "depth {}: ".format(depth)
+            + ", ".join("{} {:.1f} us".format(name, t) for name, t in results)
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,39 @@
+"""Microbenchmark of the per-call overhead of the ivy function wrappers.
+
+Compares the stacked decorator closures with the compiled dispatcher produced by
+``ivy.func_wrapper._compile_wrapped_function`` for ``ivy.add`` on scalars.
+
+Usage: python benchmarks/bench_func_wrapper.py
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+from ivy.func_wrapper import FN_DECORATORS, _compile_wrapped_function
+
+
+def _stacked(fn, decorators):
+    for attr in decorators:
+        fn = getattr(ivy, attr)(fn)
+    return fn
+
+
+def main(number=20000):
+    ivy.set_backend("numpy")
+    backend_add = ivy.current_backend().add
+    original_add = ivy.backend_handler.ivy_original_dict["add"]
+    decorators = [attr for attr in FN_DECORATORS if hasattr(original_add, attr)]
+    stacked = _stacked(backend_add, decorators)
+    compiled = _compile_wrapped_function(backend_add, decorators)
+    x, y = ivy.array(1.0), ivy.array(2.0)
+    for name, fn in [("stacked", stacked), ("compiled", compiled)]:
+        for label, args in [("0-d arrays", (x, y)), ("python scalars", (1.0, 2.0))]:
+            t = timeit.timeit(lambda: fn(*args), number=number) / number
+            print("{:>9} | {:<15}: {:8.2f} us/call".format(name, label, t * 1e6))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main()
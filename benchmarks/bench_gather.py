@@ -0,0 +1,60 @@
+"""Benchmark of batched gather and gather_nd on the numpy backend.
+
+Reports the time per call of ivy.gather and ivy.gather_nd with batch_dims=1 on an
+embedding-lookup style workload, across batch sizes, together with the time of the
+previous implementation, which looped over the batch elements in Python.
+
+Usage: python benchmarks/bench_gather.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+from ivy.functional.backends.numpy.general import gather_nd_helper
+
+
+def _loop_gather(params, indices, axis, batch_dims):
+    # reference implementation, gathering for each batch element separately
+    result = [np.take(p, i, axis - batch_dims) for p, i in zip(params, indices)]
+    return np.array(result)
+
+
+def _loop_gather_nd(params, indices):
+    result = [gather_nd_helper(p, i) for p, i in zip(params, indices)]
+    return np.array(result)
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e6
+
+
+def main(num_calls=20):
+    ivy.set_backend("numpy")
+    for batch_size in [16, 256, 4096]:
+        params = np.random.rand(batch_size, 64, 8).astype("float32")
+        indices = np.random.randint(0, 64, (batch_size, 16))
+        nd_indices = np.expand_dims(indices, -1)
+        fns = {
+            "gather": lambda: ivy.gather(params, indices, axis=1, batch_dims=1),
+            "gather loop": lambda: _loop_gather(params, indices, 1, 1),
+            "gather_nd": lambda: ivy.gather_nd(params, nd_indices, batch_dims=1),
+            "gather_nd loop": lambda: _loop_gather_nd(params, nd_indices),
+        }
+        results = [(name, _time(fn, num_calls)) for name, fn in fns.items()]
+        print(
+            "batch {}: ".format(batch_size)
+            + ", ".join("{} {:.1f} us".format(name, t) for name, t in results)
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,63 @@
+"""Benchmark of lazy container expressions on the numpy backend.
+
+Reports the time per call of an adam-style parameter update over containers with an
+increasing number of leaves, run eagerly, with one container built per operation,
+and through ivy.Container.cont_lazy, with the whole chain applied to each leaf in a
+single traversal.
+
+Usage: python benchmarks/bench_lazy_container.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+
+
+def _container(num_leaves):
+    return ivy.Container(
+        {
+            "layer_{}".format(i): {
+                "w": ivy.array(np.random.rand(8)),
+                "b": ivy.array(np.random.rand(1)),
+            }
+            for i in range(num_leaves // 2)
+        }
+    )
+
+
+def _update(w, m, g, lr=1e-3, beta1=0.9, eps=1e-7):
+    m = beta1 * m + (1 - beta1) * g
+    return w - lr * m / ((m * m).sqrt() + eps)
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e3
+
+
+def main(num_calls=3):
+    ivy.set_backend("numpy")
+    for num_leaves in [100, 1000, 10000]:
+        w, m, g = [_container(num_leaves) for _ in range(3)]
+        eager_time = _time(lambda: _update(w, m, g), num_calls)
+        lazy_time = _time(
+            lambda: _update(w.cont_lazy(), m.cont_lazy(), g.cont_lazy()).materialize(),
+            num_calls,
+        )
+        print(
+            "{} leaves: eager {:.1f} ms, lazy {:.1f} ms ({:.1f}x)".format(
+                num_leaves, eager_time, lazy_time, eager_time / lazy_time
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
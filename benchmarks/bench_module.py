@@ -0,0 +1,47 @@
+"""Benchmark of the per-step latency of a small ivy.Sequential model.
+
+Times repeated forward passes of a small multi-layer perceptron on the numpy
+backend, as in a serving loop, with and without submodule tracking.
+
+Usage: python benchmarks/bench_module.py [num_steps]
+"""
+
+# global
+import logging
+import sys
+import time
+
+# local
+import ivy
+
+
+def _time_steps(model, x, num_steps, **kwargs):
+    model(x, **kwargs)
+    start = time.perf_counter()
+    for _ in range(num_steps):
+        model(x, **kwargs)
+    return (time.perf_counter() - start) / num_steps
+
+
+def main(num_steps=1000):
+    # numpy warns about missing autograd on every variable and stop_gradient call
+    logging.disable(logging.WARNING)
+    ivy.set_backend("numpy")
+    model = ivy.Sequential(
+        ivy.Linear(8, 16),
+        ivy.Linear(16, 16),
+        ivy.Linear(16, 4),
+    )
+    x = ivy.random_uniform(shape=(1, 8))
+    for with_grads in [True, False]:
+        duration = _time_steps(model, x, num_steps, with_grads=with_grads)
+        print(
+            "with_grads={}: {:.1f} us/step".format(with_grads, duration * 1e6)
+        )
+    duration = _time_steps(model, x, num_steps // 10, track_submod_rets=True)
+    print("track_submod_rets=True: {:.1f} us/step".format(duration * 1e6))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
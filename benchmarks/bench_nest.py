@@ -0,0 +1,56 @@
+"""Benchmark of mapping nests on the numpy backend.
+
+Reports the time per call of ivy.nested_map, ivy.nested_argwhere and
+ivy.args_to_native, which run through ivy.tree_flatten and ivy.tree_unflatten, on
+nests of arrays of increasing size. It also reports the time of ivy.nested_map with
+max_depth set, which still runs through the recursive implementation.
+
+Usage: python benchmarks/bench_nest.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+
+
+def _nest(num_layers):
+    return [
+        {"w": ivy.array(np.ones((4, 4))), "b": (ivy.array(np.ones(4)), None)}
+        for _ in range(num_layers)
+    ]
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e6
+
+
+def main(num_calls=200):
+    ivy.set_backend("numpy")
+    for num_layers in [1, 10, 100]:
+        nest = _nest(num_layers)
+        fns = {
+            "nested_map": lambda: ivy.nested_map(nest, ivy.to_native, shallow=False),
+            "recursive nested_map": lambda: ivy.nested_map(
+                nest, ivy.to_native, shallow=False, max_depth=100
+            ),
+            "nested_argwhere": lambda: ivy.nested_argwhere(nest, ivy.is_array),
+            "args_to_native": lambda: ivy.args_to_native(nest, x=nest[0]),
+        }
+        results = [(name, _time(fn, num_calls)) for name, fn in fns.items()]
+        print(
+            "{} leaves: ".format(3 * num_layers)
+            + ", ".join("{} {:.1f} us".format(name, t) for name, t in results)
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,63 @@
+"""Benchmark of scatter_nd and scatter_flat reductions on the numpy backend.
+
+Reports the time per call of ivy.scatter_nd, scattering per-edge messages into
+per-node features as in graph message passing, and of ivy.scatter_flat, for each
+reduction and number of edges. It also reports the time of the unbuffered ufunc.at
+scatter, which the previous implementation used.
+
+Usage: python benchmarks/bench_scatter.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+
+_UFUNCS = {"sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e3
+
+
+def main(num_calls=3):
+    ivy.set_backend("numpy")
+    num_nodes, num_features = 10000, 16
+    for num_edges in [10000, 100000, 1000000]:
+        receivers = np.random.randint(0, num_nodes, (num_edges, 1))
+        messages = np.random.rand(num_edges, num_features).astype("float32")
+        flat_messages = messages[:, 0]
+        for reduction, ufunc in _UFUNCS.items():
+            fns = {
+                "scatter_nd": lambda: ivy.scatter_nd(
+                    receivers, messages, (num_nodes, num_features), reduction=reduction
+                ),
+                "ufunc.at": lambda: ufunc.at(
+                    np.zeros((num_nodes, num_features), "float32"),
+                    (receivers[:, 0], Ellipsis),
+                    messages,
+                ),
+                "scatter_flat": lambda: ivy.scatter_flat(
+                    receivers[:, 0], flat_messages, size=num_nodes, reduction=reduction
+                ),
+                "flat ufunc.at": lambda: ufunc.at(
+                    np.zeros(num_nodes, "float32"), receivers[:, 0], flat_messages
+                ),
+            }
+            results = [(name, _time(fn, num_calls)) for name, fn in fns.items()]
+            print(
+                "edges {} {}: ".format(num_edges, reduction)
+                + ", ".join("{} {:.1f} ms".format(name, t) for name, t in results)
+            )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
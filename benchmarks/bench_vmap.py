@@ -0,0 +1,49 @@
+"""Benchmark of ivy.vmap on the numpy backend.
+
+Reports the time per call of a vmapped per-example feature function, which is
+batched through a single trace, against mapping the function over the batch in a
+Python loop, across batch sizes.
+
+Usage: python benchmarks/bench_vmap.py [num_calls]
+"""
+
+# global
+import sys
+import time
+import numpy as np
+
+# local
+import ivy
+
+
+def _features(x, w):
+    h = ivy.tanh(ivy.matmul(x, w) + 1.0)
+    return ivy.softmax(ivy.mean(h, axis=0), axis=-1), ivy.sum(h**2, axis=-1)
+
+
+def _time(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls * 1e3
+
+
+def main(num_calls=5):
+    ivy.set_backend("numpy")
+    w = np.random.rand(32, 16)
+    vmapped = ivy.vmap(_features, in_axes=(0, None))
+    for batch_size in [16, 256, 2048]:
+        x = np.random.rand(batch_size, 8, 32)
+        vmap_time = _time(lambda: vmapped(x, w), num_calls)
+        loop_time = _time(lambda: [_features(x_, w) for x_ in x], num_calls)
+        print(
+            "batch {}: vmap {:.2f} ms, loop {:.2f} ms ({:.0f}x)".format(
+                batch_size, vmap_time, loop_time, loop_time / vmap_time
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -1,33 +1,10 @@
 # global
-from types import SimpleNamespace
+import sys
 import warnings
 from ivy._version import __version__ as __version__
 import builtins
 import numpy as np
 
-try:
-    import torch
-except ImportError:
-    torch = SimpleNamespace()
-    torch.Size = SimpleNamespace()
-    torch.Tensor = SimpleNamespace()
-
-try:
-    import tensorflow as tf
-except ImportError:
-    tf = SimpleNamespace()
-    tf.TensorShape = SimpleNamespace()
-    tf.Tensor = SimpleNamespace()
-
-try:
-    import jax
-    import jaxlib
-except ImportError:
-    jax = SimpleNamespace()
-    jax.interpreters.xla._DeviceArray = SimpleNamespace()
-    jaxlib.xla_extension.DeviceArray = SimpleNamespace()
-    jax.Buffer = SimpleNamespace()
-
 warnings.filterwarnings("ignore", module="^(?!.*ivy).*$")
 
 
@@ -192,21 +169,39 @@ class Dtype(str):
         return can_cast(self, to)
 
 
+def _native_shape_types():
+    """Returns the native shape and array types of the frameworks which have already
+    been imported, without importing any framework."""
+    native_types = (np.ndarray,)
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        native_types += (torch.Size,)
+    tf = sys.modules.get("tensorflow")
+    if tf is not None:
+        native_types += (tf.TensorShape, tf.Tensor)
+    jax = sys.modules.get("jax")
+    if jax is not None:
+        xla = sys.modules.get("jax.interpreters.xla")
+        xla_extension = sys.modules.get("jaxlib.xla_extension")
+        native_types += tuple(
+            native_type
+            for native_type in [
+                getattr(xla, "_DeviceArray", None),
+                getattr(xla_extension, "DeviceArray", None),
+                getattr(jax, "Buffer", None),
+            ]
+            if native_type is not None
+        )
+    return native_types
+
+
 class Shape(tuple):
     def __new__(cls, shape_tup):
         valid_types = (int, list, tuple, ivy.Array)
         if len(backend_stack) != 0:
             valid_types += (ivy.NativeShape, ivy.NativeArray)
         else:
-            valid_types += (
-                tf.TensorShape,
-                torch.Size,
-                jax.interpreters.xla._DeviceArray,
-                jaxlib.xla_extension.DeviceArray,
-                jax.Buffer,
-                np.ndarray,
-                tf.Tensor,
-            )
+            valid_types += _native_shape_types()
         ivy.assertions.check_isinstance(shape_tup, valid_types)
         if isinstance(shape_tup, int):
             shape_tup = (shape_tup,)
@@ -696,6 +691,8 @@ from .container import conversions as cont_conversions
 from .container import (
     ContainerBase,
     Container,
+    LazyContainer,
+    PackedContainer,
     add_ivy_container_instance_methods,
 )
 from .nested_array import NestedArray
@@ -719,7 +716,7 @@ from .functional import *
 from . import stateful
 from .stateful import *
 from . import verbosity
-from .inspection import fn_array_spec, add_array_specs
+from .inspection import fn_array_spec, add_array_specs, import_profile
 
 add_array_specs()
 
@@ -1087,6 +1084,7 @@ def set_nan_policy(warn_level):
             "nan_policy must be one of 'nothing', 'warns', 'raise_exception'"
         )
     nan_policy_stack.append(warn_level)
+    func_wrapper._refresh_compiled_modes()
 
 
 def unset_nan_policy():
@@ -1094,3 +1092,4 @@ def unset_nan_policy():
     global nan_policy_stack
     if nan_policy_stack:
         nan_policy_stack.pop(-1)
+    func_wrapper._refresh_compiled_modes()
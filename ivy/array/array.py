@@ -72,69 +72,51 @@ class Array(
     ArrayWithStatisticalExperimental,
     ArrayWithUtilityExperimental,
 ):
+    # only the core attributes are slotted, the abc mixins still provide a __dict__
+    # for any attributes set externally on the array
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_size",
+        "_dtype",
+        "_device",
+        "_post_repr",
+        "_backend",
+    )
+
+    _pre_repr = "ivy."
+
     def __init__(self, data):
-        ArrayWithActivations.__init__(self)
-        ArrayWithCreation.__init__(self)
-        ArrayWithDataTypes.__init__(self)
-        ArrayWithDevice.__init__(self)
-        ArrayWithElementwise.__init__(self)
-        ArrayWithGeneral.__init__(self)
-        ArrayWithGradients.__init__(self)
-        ArrayWithImage.__init__(self)
-        ArrayWithLayers.__init__(self)
-        ArrayWithLinearAlgebra.__init__(self)
-        ArrayWithLosses.__init__(self)
-        ArrayWithManipulation.__init__(self)
-        ArrayWithNorms.__init__(self)
-        ArrayWithRandom.__init__(self)
-        ArrayWithSearching.__init__(self)
-        ArrayWithSet.__init__(self)
-        ArrayWithSorting.__init__(self)
-        ArrayWithStatistical.__init__(self)
-        ArrayWithUtility.__init__(self)
-        ArrayWithActivationsExperimental.__init__(self),
-        ArrayWithConversionsExperimental.__init__(self),
-        ArrayWithCreationExperimental.__init__(self),
-        ArrayWithData_typeExperimental.__init__(self),
-        ArrayWithDeviceExperimental.__init__(self),
-        ArrayWithElementWiseExperimental.__init__(self),
-        ArrayWithGeneralExperimental.__init__(self),
-        ArrayWithGradientsExperimental.__init__(self),
-        ArrayWithImageExperimental.__init__(self),
-        ArrayWithLayersExperimental.__init__(self),
-        ArrayWithLinearAlgebraExperimental.__init__(self),
-        ArrayWithLossesExperimental.__init__(self),
-        ArrayWithManipulationExperimental.__init__(self),
-        ArrayWithNormsExperimental.__init__(self),
-        ArrayWithRandomExperimental.__init__(self),
-        ArrayWithSearchingExperimental.__init__(self),
-        ArrayWithSetExperimental.__init__(self),
-        ArrayWithSortingExperimental.__init__(self),
-        ArrayWithStatisticalExperimental.__init__(self),
-        ArrayWithUtilityExperimental.__init__(self),
+        # the mixins have no state of their own, so there are no mixin __init__ methods
+        # to call, and all metadata other than the shape is computed on first access
         self._init(data)
 
     def _init(self, data):
-        if ivy.is_ivy_array(data):
-            self._data = data.data
-        else:
+        if isinstance(data, ivy.Array):
+            data = data.data
+        elif not isinstance(data, ivy.NativeArray):
             ivy.assertions.check_true(
                 ivy.is_native_array(data), "data must be native array"
             )
-            self._data = data
-        self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
-        self.backend = ivy.current_backend_str()
+        self._data = data
+        self._shape = data.shape
+        self._size = None
+        self._dtype = None
+        self._device = None
+        self._post_repr = None
+        # the backend which created the array, used for the lazily computed metadata
+        self._backend = ivy.backend_stack[-1] if ivy.backend_stack else None
+
+    def _backend_fn(self, fn_name):
+        backend = self._backend
+        if backend is None:
+            # no backend was set when the array was created, so the backend which
+            # created it is inferred from the native array rather than using
+            # whichever backend is set by the time of the first access
+            backend = ivy.backend_handler._determine_backend_from_args([self._data])
+            if backend is None:
+                return ivy.__dict__[fn_name]
+        return backend.__dict__[fn_name]
 
     # Properties #
     # ---------- #
@@ -147,13 +129,24 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = self._backend_fn("dtype")(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._backend_fn("dev")(self._data)
         return self._device
 
+    @property
+    def backend(self) -> str:
+        """The backend which was globally set when the array was created."""
+        if self._backend is None:
+            return ""
+        return self._backend.current_backend_str()
+
     @property
     def mT(self) -> ivy.Array:
         """
@@ -183,6 +176,10 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            self._size = (
+                functools.reduce(mul, self._shape) if len(self._shape) > 0 else 0
+            )
         return self._size
 
     @property
@@ -243,7 +240,13 @@ class Array(
             ivy.get_backend(self.backend) if self.backend else ivy.current_backend()
         )
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        if self._post_repr is None:
+            dev_str = ivy.as_ivy_dev(self.device)
+            if "gpu" in dev_str:
+                self._post_repr = ", dev={})".format(dev_str)
+            else:
+                self._post_repr = ")"
         with np.printoptions(precision=dec_vals):
             return (
                 self._pre_repr
@@ -271,7 +274,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -299,7 +302,8 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.unset_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        for attr in Array.__slots__:
+            setattr(self, attr, getattr(ivy_array, attr))
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -91,8 +91,12 @@ def args_to_ivy(
         instances.
 
     """
-    native_args = ivy.nested_map(args, _to_ivy, include_derived, shallow=False)
-    native_kwargs = ivy.nested_map(kwargs, _to_ivy, include_derived, shallow=False)
+    leaves, treedef = ivy.tree_flatten(
+        [args, kwargs], include_derived=include_derived
+    )
+    native_args, native_kwargs = ivy.tree_unflatten(
+        treedef, [_to_ivy(x) for x in leaves]
+    )
     return native_args, native_kwargs
 
 
@@ -165,16 +169,10 @@ def args_to_native(
         native form.
 
     """
-    native_args = ivy.nested_map(
-        args,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
+    leaves, treedef = ivy.tree_flatten(
+        [args, kwargs], include_derived=include_derived
     )
-    native_kwargs = ivy.nested_map(
-        kwargs,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
+    native_args, native_kwargs = ivy.tree_unflatten(
+        treedef, [_to_native(x, inplace=cont_inplace) for x in leaves]
     )
     return native_args, native_kwargs
@@ -6,7 +6,7 @@ from ivy import verbosity
 from typing import Optional
 
 # local
-from ivy.func_wrapper import _wrap_function
+from ivy.func_wrapper import _wrap_function, _nested_leaves
 
 backend_stack = []
 implicit_backend = "numpy"
@@ -45,6 +45,18 @@ _backend_reverse_dict["ivy.functional.backends.jax"] = "jax"
 _backend_reverse_dict["ivy.functional.backends.tensorflow"] = "tensorflow"
 _backend_reverse_dict["ivy.functional.backends.torch"] = "torch"
 
+# fully wrapped ivy namespaces of each backend, keyed by backend module name, with
+# the original ivy namespace they were wrapped from and the keys they remove
+_wrapped_namespaces = dict()
+
+# backend handles returned by get_backend, keyed by backend module name, together
+# with the version of the ivy namespace they were completed with
+_backend_handles = dict()
+
+# incremented whenever a new snapshot of the ivy namespace has a different set of
+# functions, i.e. once functions have been registered or removed
+_ivy_namespace_version = 0
+
 
 # Backend Getting/Setting #
 # ----------------------- #
@@ -74,24 +86,12 @@ def _determine_backend_from_args(args):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>    # noqa
 
     """
-    for arg in args:
-        arg_type = type(arg)
-        # function is called recursively if arg is a list/tuple
-        if arg_type in [list, tuple]:
-            lib = _determine_backend_from_args(arg)
-            if lib:
-                return lib
-        # function is called recursively if arg is a dict
-        elif arg_type is dict:
-            lib = _determine_backend_from_args(list(arg.values()))
-            if lib:
-                return lib
-        else:
-            # use the _array_types dict to map the module where arg comes from, to the
-            # corresponding Ivy backend
-            if arg.__class__.__module__ in _array_types:
-                module_name = _array_types[arg.__class__.__module__]
-                return importlib.import_module(module_name)
+    for arg in _nested_leaves(args, include_derived=False):
+        # use the _array_types dict to map the module where arg comes from, to the
+        # corresponding Ivy backend
+        if arg.__class__.__module__ in _array_types:
+            module_name = _array_types[arg.__class__.__module__]
+            return importlib.import_module(module_name)
 
 
 def fn_name_from_version_specific_fn_name(name, version):
@@ -141,6 +141,46 @@ def fn_name_from_version_specific_fn_name(name, version):
             return name[0:i]
 
 
+def _get_wrapped_namespace(backend):
+    """Return the cached wrapped namespace of `backend`, provided it was wrapped from
+    the current original ivy namespace, otherwise None.
+
+    Parameters
+    ----------
+    backend
+        the backend module for which to retrieve the wrapped namespace.
+
+    Returns
+    -------
+    ret
+        tuple of the wrapped functions and the keys to remove from the ivy namespace,
+        or None if there is no valid cached namespace.
+    """
+    cached = _wrapped_namespaces.get(backend.__name__)
+    if cached is None:
+        return None
+    original_dict, wrapped_dict, removed_keys = cached
+    if original_dict is not ivy_original_dict:
+        if len(original_dict) != len(ivy_original_dict):
+            return None
+        for k, v in original_dict.items():
+            if k not in ivy_original_dict or ivy_original_dict[k] is not v:
+                return None
+        _wrapped_namespaces[backend.__name__] = (
+            ivy_original_dict,
+            wrapped_dict,
+            removed_keys,
+        )
+    return wrapped_dict, removed_keys
+
+
+def _set_wrapped_namespace(wrapped_dict, removed_keys):
+    """Swap the wrapped backend functions into the ivy namespace in bulk."""
+    ivy.__dict__.update(wrapped_dict)
+    for k in removed_keys:
+        ivy.__dict__.pop(k, None)
+
+
 def set_backend_to_specific_version(backend):
     """
     Updates the backend dict to make the original function
@@ -242,8 +282,10 @@ def set_backend(backend: str):
         "backend must be one from {}".format(list(_backend_dict.keys())),
     )
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
+    global ivy_original_dict, _ivy_namespace_version
     if not backend_stack:
+        if ivy.__dict__.keys() != ivy_original_dict.keys():
+            _ivy_namespace_version += 1
         ivy_original_dict = ivy.__dict__.copy()
     if isinstance(backend, str):
         temp_stack = list()
@@ -257,17 +299,31 @@ def set_backend(backend: str):
     elif backend.current_backend_str() == "jax":
         ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
     backend_stack.append(backend)
-    set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+    wrapped_namespace = _get_wrapped_namespace(backend)
+    if wrapped_namespace is None:
+        set_backend_to_specific_version(backend)
+        wrapped_dict = dict()
+        removed_keys = list()
+        for k, v in ivy_original_dict.items():
+            compositional = k not in backend.__dict__
+            if k not in backend.__dict__:
+                if k in backend.invalid_dtypes and k in ivy.__dict__:
+                    removed_keys.append(k)
+                    continue
+                backend.__dict__[k] = v
+            wrapped_dict[k] = _wrap_function(
+                key=k,
+                to_wrap=backend.__dict__[k],
+                original=v,
+                compositional=compositional,
+            )
+        wrapped_namespace = (wrapped_dict, removed_keys)
+        _wrapped_namespaces[backend.__name__] = (
+            ivy_original_dict,
+            wrapped_dict,
+            removed_keys,
         )
+    _set_wrapped_namespace(*wrapped_namespace)
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
@@ -331,20 +387,31 @@ def get_backend(backend: Optional[str] = None):
     # ToDo: change this so that it doesn't depend at all on the global ivy. Currently
     #  all backend-agnostic implementations returned in this module will still
     #  use the global ivy backend.
-    global ivy_original_dict
-    if not backend_stack:
+    global ivy_original_dict, _ivy_namespace_version
+    # only take a new snapshot of the ivy namespace once functions have been
+    # registered or removed, comparing the full key set rather than its size
+    if not backend_stack and ivy.__dict__.keys() != ivy_original_dict.keys():
         ivy_original_dict = ivy.__dict__.copy()
+        _ivy_namespace_version += 1
     # current global backend is retrieved if backend isn't specified,
     # otherwise `backend` argument will be used
     if backend is None:
-        backend = ivy.current_backend()
         if not backend_stack:
             return ""
-    elif isinstance(backend, str):
-        backend = importlib.import_module(_backend_dict[backend])
+        backend = backend_stack[-1]
+    backend_name = (
+        _backend_dict[backend] if isinstance(backend, str) else backend.__name__
+    )
+    handle = _backend_handles.get(backend_name)
+    if handle is not None and handle[1] == _ivy_namespace_version:
+        return handle[0]
+    if isinstance(backend, str):
+        backend = importlib.import_module(backend_name)
+    # the compositional fill-in only runs again once new functions are registered
     for k, v in ivy_original_dict.items():
         if k not in backend.__dict__:
             backend.__dict__[k] = v
+    _backend_handles[backend_name] = (backend, _ivy_namespace_version)
     return backend
 
 
@@ -395,16 +462,23 @@ def unset_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
+        wrapped_namespace = (
+            _get_wrapped_namespace(backend_stack[-1]) if backend_stack else None
         )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        if wrapped_namespace is not None:
+            # swap in the namespace cached when the previous backend was set
+            _set_wrapped_namespace(*wrapped_namespace)
+        else:
+            new_backend_dict = (
+                backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
+            )
+            # wrap backend functions if there still is a backend, and add functions
+            # to ivy namespace
+            for k, v in new_backend_dict.items():
+                if backend_stack and k in ivy_original_dict:
+                    v = _wrap_function(k, v, ivy_original_dict[k])
+                if k in ivy_original_dict:
+                    ivy.__dict__[k] = v
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -12,5 +12,7 @@ except ModuleNotFoundError:
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
+from .lazy import LazyContainer  # noqa
+from .packed import PackedContainer  # noqa
 
 colorama.init(strip=False)
@@ -19,9 +19,11 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import queue
 import random
+import threading
 from operator import mul
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import Union, Tuple
 from builtins import set
 
@@ -47,6 +49,253 @@ def _repr(x):
         return str(x)
 
 
+@lru_cache(maxsize=1024)
+def _has_out_argument(fn):
+    return inspect.signature(fn).parameters.get("out") is not None
+
+
+def _h5_option(option, key, leaf=False):
+    # resolve a per key chain dataset option for a child group or a leaf dataset
+    if not isinstance(option, dict):
+        return option
+    if leaf:
+        return option.get(key)
+    prefix = key + "/"
+    return {
+        k[len(prefix) :]: v
+        for k, v in option.items()
+        if isinstance(k, str) and k.startswith(prefix)
+    }
+
+
+class _ContainerH5Writer:
+    """Streaming writer, which appends containers to the datasets of an h5py file
+    along axis 0, optionally writing on a background thread. At most one batch is
+    pending at any time, which bounds the memory to one batch in flight.
+    """
+
+    def __init__(
+        self,
+        h5_obj_or_filepath,
+        mode="a",
+        chunks=None,
+        compression=None,
+        background=True,
+    ):
+        if type(h5_obj_or_filepath) is str:
+            self._h5_obj = h5py.File(h5_obj_or_filepath, mode)
+            self._owns_file = True
+        else:
+            self._h5_obj = h5_obj_or_filepath
+            self._owns_file = False
+        self._chunks = chunks
+        self._compression = compression
+        _, self.batch_size = ivy.Container.h5_file_size(self._h5_obj)
+        self._exception = None
+        self._queue = None
+        if background:
+            self._queue = queue.Queue(maxsize=1)
+            self._thread = threading.Thread(target=self._write_loop, daemon=True)
+            self._thread.start()
+
+    def _write(self, container):
+        container.cont_to_disk_as_hdf5(
+            self._h5_obj,
+            self.batch_size,
+            chunks=self._chunks,
+            compression=self._compression,
+        )
+        self.batch_size += container.cont_to_iterator_values().__next__().shape[0]
+
+    def _write_loop(self):
+        while True:
+            container = self._queue.get()
+            try:
+                if container is None:
+                    return
+                if self._exception is None:
+                    self._write(container)
+            except Exception as e:
+                self._exception = e
+            finally:
+                self._queue.task_done()
+
+    def _check_exception(self):
+        if self._exception is not None:
+            exception, self._exception = self._exception, None
+            raise exception
+
+    def append(self, container):
+        """Append a container to the file. The leaves are copied to numpy arrays
+        before returning, so they can be modified while the batch is written.
+
+        Parameters
+        ----------
+        container
+            Container to append, with all leaves sharing the same batch size.
+
+        """
+        self._check_exception()
+        container = container.cont_map(
+            lambda x, _: ivy.to_numpy(x) if ivy.is_array(x) else np.asarray(x)
+        )
+        if self._queue is None:
+            self._write(container)
+        else:
+            self._queue.put(container)
+
+    def flush(self):
+        """Wait until all appended containers have been written."""
+        if self._queue is not None:
+            self._queue.join()
+        self._check_exception()
+        self._h5_obj.flush()
+
+    def close(self):
+        """Write all appended containers, and close the file if it was opened by
+        the writer.
+        """
+        try:
+            if self._queue is not None and self._thread.is_alive():
+                self._queue.join()
+                self._queue.put(None)
+                self._thread.join()
+            self._check_exception()
+        finally:
+            if self._owns_file:
+                self._h5_obj.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# name of the dataset storing the row permutation of virtually shuffled h5 files
+_H5_PERMUTATION_KEY = "_ivy_permutation"
+
+# approximate number of bytes per block of rows, when reading h5 datasets in blocks
+_H5_BLOCK_BYTES = 2**26
+
+
+def _h5_block_size(dataset, block_size=None):
+    if block_size is not None:
+        return max(1, block_size)
+    row_bytes = reduce(mul, dataset.shape[1:], 1) * dataset.dtype.itemsize
+    return max(1, _H5_BLOCK_BYTES // max(1, row_bytes))
+
+
+def _h5_permutation(h5_obj):
+    permutation = h5_obj.file.get(_H5_PERMUTATION_KEY)
+    return None if permutation is None else permutation[()]
+
+
+def _h5_rows(permutation, num_rows):
+    # restrict or extend the permutation to a dataset with num_rows rows
+    if len(permutation) < num_rows:
+        return np.concatenate(
+            [permutation, np.arange(len(permutation), num_rows, dtype=np.int64)]
+        )
+    if len(permutation) > num_rows:
+        return permutation[permutation < num_rows]
+    return permutation
+
+
+def _h5_read_rows(dataset, rows, block_size=None):
+    # gather rows from a dataset with a single sequential pass over blocks of rows,
+    # rather than one disk round trip per row
+    ret = np.empty((len(rows),) + dataset.shape[1:], dtype=dataset.dtype)
+    if not len(rows):
+        return ret
+    order = np.argsort(rows, kind="stable")
+    sorted_rows = rows[order]
+    block_size = _h5_block_size(dataset, block_size)
+    start = sorted_rows[0]
+    while start <= sorted_rows[-1]:
+        stop = start + block_size
+        lo, hi = np.searchsorted(sorted_rows, [start, stop])
+        block = dataset[start:stop]
+        ret[order[lo:hi]] = block[sorted_rows[lo:hi] - start]
+        if hi == len(sorted_rows):
+            break
+        start = max(stop, sorted_rows[hi])
+    return ret
+
+
+def _shuffle_h5_group(h5_obj, out_obj, permutation, block_size=None):
+    for key, value in list(h5_obj.items()):
+        if key == _H5_PERMUTATION_KEY:
+            continue
+        if isinstance(value, h5py.Group):
+            _shuffle_h5_group(
+                value,
+                None if out_obj is None else out_obj.require_group(key),
+                permutation,
+                block_size,
+            )
+        elif isinstance(value, h5py.Dataset):
+            if out_obj is None:
+                if not value.shape:
+                    continue
+                # write to a temporary dataset, which then replaces the original
+                shuffled_key = key + "_shuffled"
+                shuffled = h5_obj.create_dataset_like(shuffled_key, value)
+            else:
+                if key in out_obj:
+                    del out_obj[key]
+                shuffled = out_obj.create_dataset_like(key, value)
+                if not value.shape:
+                    shuffled[()] = value[()]
+                    continue
+            rows = _h5_rows(permutation, value.shape[0])
+            this_block_size = _h5_block_size(value, block_size)
+            for start in range(0, len(rows), this_block_size):
+                shuffled[start : start + this_block_size] = _h5_read_rows(
+                    value, rows[start : start + this_block_size], this_block_size
+                )
+            if out_obj is None:
+                del h5_obj[key]
+                h5_obj.move(shuffled_key, key)
+        else:
+            raise ivy.exceptions.IvyException(
+                "Item found inside h5_obj which was neither a Group nor a Dataset."
+            )
+
+
+def _h5_dataset_to_numpy(dataset, slice_obj, memory_map=False, permutation=None):
+    if permutation is not None and dataset.shape:
+        rows = _h5_rows(permutation, dataset.shape[0])
+        if not isinstance(slice_obj, slice):
+            return _h5_read_rows(dataset, rows)[slice_obj]
+        return _h5_read_rows(dataset, rows[slice_obj])
+    if (
+        memory_map
+        and dataset.file.driver == "sec2"
+        and dataset.chunks is None
+        and not dataset.external
+        and not dataset.dtype.hasobject
+    ):
+        # uncompressed contiguous datasets can be mapped straight from the file
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            return np.memmap(
+                dataset.file.filename,
+                dtype=dataset.dtype,
+                mode="r",
+                offset=offset,
+                shape=dataset.shape,
+            )[slice_obj]
+    if not isinstance(slice_obj, slice) or not dataset.shape:
+        return dataset[slice_obj]
+    # read into a single preallocated buffer, without intermediate copies
+    num_rows = len(range(*slice_obj.indices(dataset.shape[0])))
+    ret = np.empty((num_rows,) + dataset.shape[1:], dtype=dataset.dtype)
+    if ret.size:
+        dataset.read_direct(ret, source_sel=slice_obj)
+    return ret
+
+
 # noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
     def __init__(
@@ -172,26 +421,16 @@ class ContainerBase(dict, abc.ABC):
         inspect_fn = fn
         if isinstance(fn, str):
             inspect_fn = ivy.__dict__[fn]
-        # retrieve indices where leaves of args are also nested
-        arg_cont_idxs = ivy.nested_argwhere(
-            args, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
-        # retrieve indices where leaves of kwargs are also nested
-        kwarg_cont_idxs = ivy.nested_argwhere(
-            kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
+        # flatten args and kwargs once, retrieving the positions of the containers
+        # among the leaves, so that only these need to be substituted for each leaf
+        leaves, treedef = ivy.tree_flatten(
+            (args, kwargs), include_derived=True, to_ignore=ivy.Container
         )
+        cont_idxs = [i for i, leaf in enumerate(leaves) if ivy.is_ivy_container(leaf)]
+        conts = [leaves[i] for i in cont_idxs]
 
-        # retrieve all the containers in args
-        arg_conts = ivy.multi_index_nest(args, arg_cont_idxs)
-        num_arg_conts = len(arg_conts)
-
-        # retrieve all the containers in kwargs
-        kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
-        # Combine the retrieved containers from args and kwargs into a single list
-        with_out = (
-            inspect.signature(inspect_fn).parameters.get("out") is not None
-            and out is not None
-        )
+        # Combine the retrieved containers from args and kwargs with those in out
+        with_out = out is not None and _has_out_argument(inspect_fn)
         if with_out:
             out_conts = [out]
             num_out_conts = 1
@@ -202,9 +441,7 @@ class ContainerBase(dict, abc.ABC):
                 )
                 out_conts = ivy.multi_index_nest(out, out_cont_idxs)
                 num_out_conts = len(out_conts)
-            conts = arg_conts + kwarg_conts + out_conts
-        else:
-            conts = arg_conts + kwarg_conts
+            conts = conts + out_conts
         ivy.assertions.check_exists(conts, message="no containers found in arguments")
         cont0 = conts[0]
         if isinstance(fn, str):
@@ -216,12 +453,9 @@ class ContainerBase(dict, abc.ABC):
             if with_out:
                 out = vals[-num_out_conts:]
                 del vals[-num_out_conts:]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args, to_mutable=True)
-            ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs, to_mutable=True)
-            ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+            for idx, val in zip(cont_idxs, vals):
+                leaves[idx] = val
+            a, kw = ivy.tree_unflatten(treedef, leaves)
             if with_out:
                 out = out[0] if len(out) == 1 else out
                 return fn(*a, out=out, **kw)
@@ -1087,7 +1321,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        memory_map=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1104,6 +1342,11 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        memory_map
+            Whether to memory-map uncompressed contiguous datasets rather than reading
+            them, such that their data is only read from disk once accessed. All other
+            datasets are read directly into their arrays. Default is ``False``.
+            Virtually shuffled files are always read directly, in permuted order.
 
         Returns
         -------
@@ -1121,14 +1364,21 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
+        permutation = _h5_permutation(h5_obj)
         for key, value in items:
+            if key == _H5_PERMUTATION_KEY:
+                continue
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    memory_map=memory_map,
                 )
             elif isinstance(value, h5py.Dataset):
                 container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
+                    _h5_dataset_to_numpy(value, slice_obj, memory_map, permutation)
                 )
             else:
                 raise ivy.exceptions.IvyException(
@@ -1207,6 +1457,8 @@ class ContainerBase(dict, abc.ABC):
         size = 0
         batch_size = 0
         for key, value in h5_obj.items():
+            if key == _H5_PERMUTATION_KEY:
+                continue
             if isinstance(value, h5py.Group):
                 size_to_add, batch_size = ivy.Container.h5_file_size(value)
                 size += size_to_add
@@ -1221,9 +1473,12 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath, seed_value=0, block_size=None, out=None, virtual=False
+    ):
         """Shuffle entries in all datasets of h5 file, such that they are still aligned
-        along axis 0.
+        along axis 0. The datasets are shuffled out-of-core in blocks of rows, such
+        that only a bounded number of rows is held in memory at any time.
 
         Parameters
         ----------
@@ -1231,6 +1486,16 @@ class ContainerBase(dict, abc.ABC):
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        block_size
+            Number of rows of each dataset to hold in memory at once. Default is
+            ``None``, for blocks of about 64MB.
+        out
+            Filepath or h5 object to write the shuffled datasets to. Default is
+            ``None``, which shuffles the datasets in place.
+        virtual
+            Whether to only store the permutation of the rows in the file, which is
+            then applied when loading with ``cont_from_disk_as_hdf5``, rather than
+            moving any data on disk. Default is ``False``.
 
         """
         ivy.assertions.check_exists(
@@ -1238,6 +1503,11 @@ class ContainerBase(dict, abc.ABC):
             message="You must install python package h5py in order to shuffle \
             hdf5 files on disk.",
         )
+        ivy.assertions.check_false(
+            virtual and ivy.exists(out),
+            message="virtual shuffling stores the permutation in the file itself, "
+            "and cannot write to out",
+        )
         if seed_value is None:
             seed_value = random.randint(0, 1000)
         if type(h5_obj_or_filepath) is str:
@@ -1245,17 +1515,32 @@ class ContainerBase(dict, abc.ABC):
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
+        _, batch_size = ivy.Container.h5_file_size(h5_obj)
+        random.seed(seed_value)
+        permutation = list(range(batch_size))
+        random.shuffle(permutation)
+        permutation = np.array(permutation, dtype=np.int64)
+        # rows which are already virtually shuffled are shuffled further
+        previous_permutation = _h5_permutation(h5_obj)
+        if previous_permutation is not None:
+            permutation = _h5_rows(previous_permutation, batch_size)[permutation]
+
+        if virtual:
+            if _H5_PERMUTATION_KEY in h5_obj.file:
+                del h5_obj.file[_H5_PERMUTATION_KEY]
+            h5_obj.file.create_dataset(_H5_PERMUTATION_KEY, data=permutation)
+        elif ivy.exists(out):
+            if type(out) is str:
+                out_obj = h5py.File(out, "w")
             else:
-                raise ivy.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
-                )
+                out_obj = out
+            _shuffle_h5_group(h5_obj, out_obj, permutation, block_size)
+            if type(out) is str:
+                out_obj.close()
+        else:
+            _shuffle_h5_group(h5_obj, None, permutation, block_size)
+            if previous_permutation is not None:
+                del h5_obj.file[_H5_PERMUTATION_KEY]
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1927,9 +2212,16 @@ class ContainerBase(dict, abc.ABC):
         )
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
     ):
         """Save container object to disk, as an h5py file, at the specified filepath.
+        Existing datasets are grown along axis 0 if the batch does not fit.
 
         Parameters
         ----------
@@ -1944,6 +2236,13 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of newly created datasets, or a dict mapping key chains to
+            chunk shapes. Default is ``None``, for automatic chunking.
+        compression
+            Compression filter of newly created datasets, such as 'gzip' or 'lzf', or a
+            dict mapping key chains to compression filters. Default is ``None``, for no
+            compression.
 
         """
         ivy.assertions.check_exists(
@@ -1962,10 +2261,18 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks=_h5_option(chunks, key),
+                    compression=_h5_option(compression, key),
                 )
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
+                if isinstance(value, np.ndarray):
+                    value_as_np = value
+                else:
+                    value_as_np = self._cont_ivy.to_numpy(value)
                 value_shape = value_as_np.shape
                 this_batch_size = value_shape[0]
                 if not max_batch_size:
@@ -1974,14 +2281,115 @@ class ContainerBase(dict, abc.ABC):
                     dataset_shape = [max_batch_size] + list(value_shape[1:])
                     maxshape = [None for _ in dataset_shape]
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=_h5_option(chunks, key, leaf=True),
+                        compression=_h5_option(compression, key, leaf=True),
                     )
                 space_left = max_batch_size - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                h5_obj[key][
+                dataset = h5_obj[key]
+                if dataset.shape[0] < starting_index + amount_to_write:
+                    dataset.resize(starting_index + amount_to_write, axis=0)
+                dataset[
                     starting_index : starting_index + amount_to_write
                 ] = value_as_np[0:amount_to_write]
 
+    def cont_append_to_disk_as_hdf5(
+        self, h5_obj_or_filepath, chunks=None, compression=None
+    ):
+        """Append container object to the datasets of an h5py file along axis 0,
+        growing the datasets rather than rewriting the file. The datasets are created
+        if the file is empty.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath for where to save the container to disk, or h5 object.
+        chunks
+            Chunk shape of newly created datasets, or a dict mapping key chains to
+            chunk shapes. Default is ``None``, for automatic chunking.
+        compression
+            Compression filter of newly created datasets, such as 'gzip' or 'lzf', or a
+            dict mapping key chains to compression filters. Default is ``None``, for no
+            compression.
+
+        Returns
+        -------
+            The batch size of the file after appending.
+
+        """
+        ivy.assertions.check_exists(
+            h5py,
+            message="You must install python package h5py in order to save \
+            containers to disk as hdf5 files.",
+        )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj = h5py.File(h5_obj_or_filepath, "a")
+        else:
+            h5_obj = h5_obj_or_filepath
+        _, starting_index = ivy.Container.h5_file_size(h5_obj)
+        batch_size = self.cont_to_iterator_values().__next__().shape[0]
+        self.cont_to_disk_as_hdf5(
+            h5_obj,
+            starting_index,
+            chunks=chunks,
+            compression=compression,
+        )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj.close()
+        return starting_index + batch_size
+
+    @staticmethod
+    def cont_hdf5_writer(
+        h5_obj_or_filepath, mode="a", chunks=None, compression=None, background=True
+    ):
+        """Create a streaming writer, which appends containers to the datasets of an
+        h5py file along axis 0 without rewriting the file.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath for where to save the containers to disk, or h5 object.
+        mode
+            H5 read/write mode for writing to disk, ['r+', 'w', 'w-', 'a'], default is
+            'a'.
+        chunks
+            Chunk shape of newly created datasets, or a dict mapping key chains to
+            chunk shapes. Default is ``None``, for automatic chunking.
+        compression
+            Compression filter of newly created datasets, such as 'gzip' or 'lzf', or a
+            dict mapping key chains to compression filters. Default is ``None``, for no
+            compression.
+        background
+            Whether to write on a background thread, overlapping the writes with the
+            computation of the next batch. Default is ``True``.
+
+        Returns
+        -------
+            Writer with ``append``, ``flush`` and ``close`` methods, which can also be
+            used as a context manager.
+
+        Examples
+        --------
+        >>> with ivy.Container.cont_hdf5_writer("data.hdf5", mode="w") as writer:
+        ...     for _ in range(3):
+        ...         writer.append(ivy.Container(a=ivy.zeros((2, 3))))
+        >>> ivy.Container.h5_file_size("data.hdf5")
+        (72, 6)
+
+        """
+        ivy.assertions.check_exists(
+            h5py,
+            message="You must install python package h5py in order to save \
+            containers to disk as hdf5 files.",
+        )
+        return _ContainerH5Writer(
+            h5_obj_or_filepath, mode, chunks, compression, background
+        )
+
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified filepath.
 
@@ -3101,6 +3509,55 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_pack(self):
+        """Pack the array leaves of the container into one flat buffer per data type
+        and device.
+
+        Elementwise operations on the returned :class:`ivy.PackedContainer` then run
+        once per buffer rather than once per leaf, and
+        :meth:`ivy.PackedContainer.cont_unpack` restores the container.
+
+        Returns
+        -------
+            The packed container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3.]))
+        >>> y = (x.cont_pack() * 2 + 1).cont_unpack()
+        >>> print(y)
+        {
+            a: ivy.array([3., 5.]),
+            b: ivy.array([7.])
+        }
+
+        """
+        return ivy.PackedContainer.pack(self)
+
+    def cont_lazy(self):
+        """Start a lazy chain of leaf-wise operations on the container.
+
+        The operations applied to the returned :class:`ivy.LazyContainer` are recorded,
+        and are only executed when it is materialized, in a single traversal of the
+        containers involved.
+
+        Returns
+        -------
+            The lazy container, holding this container as its input.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3.]))
+        >>> y = (x.cont_lazy() * 2 + 1).materialize()
+        >>> print(y)
+        {
+            a: ivy.array([3., 5.]),
+            b: ivy.array([7.])
+        }
+
+        """
+        return ivy.LazyContainer(None, (self,))
+
     def cont_map(
         self,
         func,
@@ -0,0 +1,159 @@
+"""Lazy leaf-wise expressions over containers."""
+
+# global
+import operator
+
+# local
+import ivy
+
+
+def _binary_op(op):
+    def _op(self, other):
+        return LazyContainer(op, (self, other))
+
+    return _op
+
+
+def _reflected_binary_op(op):
+    def _op(self, other):
+        return LazyContainer(op, (other, self))
+
+    return _op
+
+
+def _unary_op(op):
+    def _op(self):
+        return LazyContainer(op, (self,))
+
+    return _op
+
+
+class LazyContainer:
+    """A chain of leaf-wise operations on containers, which is only executed once
+    materialized.
+
+    Created with :meth:`ivy.Container.cont_lazy`. Arithmetic operators and ivy
+    functions called as methods are recorded instead of being executed, and
+    :meth:`materialize` then applies the whole chain to each leaf in a single traversal
+    of the containers, building one result container rather than one per operation.
+
+    Examples
+    --------
+    >>> c1 = ivy.Container(a=ivy.array([1., 4.]), b=ivy.array([9.]))
+    >>> c2 = ivy.Container(a=ivy.array([2., 0.]), b=ivy.array([0.]))
+    >>> y = ((c1.cont_lazy() * 2 + c2) / 2).sqrt()
+    >>> print(y.materialize())
+    {
+        a: ivy.array([1.41421354, 2.]),
+        b: ivy.array([3.])
+    }
+    """
+
+    def __init__(self, fn, args, kwargs=None):
+        # fn is None for the input nodes, which hold the container as their only arg
+        self._fn = fn
+        self._args = args
+        self._kwargs = ivy.default(kwargs, {})
+
+    def __getattr__(self, item):
+        fn = ivy.__dict__.get(item) if not item.startswith("_") else None
+        if not callable(fn):
+            raise AttributeError(
+                "'LazyContainer' object has no attribute '{}'".format(item)
+            )
+
+        def _record(*args, **kwargs):
+            return LazyContainer(fn, (self,) + args, kwargs)
+
+        return _record
+
+    def __repr__(self):
+        return "LazyContainer({})".format(
+            "input" if self._fn is None else getattr(self._fn, "__name__", self._fn)
+        )
+
+    __add__ = _binary_op(operator.add)
+    __radd__ = _reflected_binary_op(operator.add)
+    __sub__ = _binary_op(operator.sub)
+    __rsub__ = _reflected_binary_op(operator.sub)
+    __mul__ = _binary_op(operator.mul)
+    __rmul__ = _reflected_binary_op(operator.mul)
+    __truediv__ = _binary_op(operator.truediv)
+    __rtruediv__ = _reflected_binary_op(operator.truediv)
+    __floordiv__ = _binary_op(operator.floordiv)
+    __rfloordiv__ = _reflected_binary_op(operator.floordiv)
+    __mod__ = _binary_op(operator.mod)
+    __rmod__ = _reflected_binary_op(operator.mod)
+    __pow__ = _binary_op(operator.pow)
+    __rpow__ = _reflected_binary_op(operator.pow)
+    __lt__ = _binary_op(operator.lt)
+    __le__ = _binary_op(operator.le)
+    __gt__ = _binary_op(operator.gt)
+    __ge__ = _binary_op(operator.ge)
+    __neg__ = _unary_op(operator.neg)
+    __abs__ = _unary_op(operator.abs)
+
+    def _compile(self):
+        # orders the distinct input containers and then the operations of the graph,
+        # such that each one gets a slot in the list of values computed at a leaf, and
+        # each shared sub-expression is only computed once per leaf
+        conts, nodes, slots = [], [], {}
+
+        def _visit(x):
+            if isinstance(x, ivy.Container):
+                if id(x) not in slots:
+                    slots[id(x)] = None
+                    conts.append(x)
+            elif isinstance(x, LazyContainer) and id(x) not in slots:
+                slots[id(x)] = None
+                for arg in x._args + tuple(x._kwargs.values()):
+                    _visit(arg)
+                if x._fn is not None:
+                    nodes.append(x)
+
+        _visit(self)
+        for i, x in enumerate(conts + nodes):
+            slots[id(x)] = i
+
+        def _ref(x):
+            if isinstance(x, LazyContainer) and x._fn is None:
+                x = x._args[0]
+            if isinstance(x, (ivy.Container, LazyContainer)):
+                return True, slots[id(x)]
+            return False, x
+
+        steps = [
+            (
+                x._fn,
+                tuple(_ref(arg) for arg in x._args),
+                {k: _ref(v) for k, v in x._kwargs.items()},
+            )
+            for x in nodes
+        ]
+        return conts, steps, _ref(self)[1]
+
+    def materialize(self) -> ivy.Container:
+        """Executes the recorded chain of operations on each leaf of the containers.
+
+        Returns
+        -------
+        ret
+            The container holding the result of the chain at each leaf.
+        """
+        conts, steps, out_slot = self._compile()
+
+        def _run(vals):
+            for fn, args, kwargs in steps:
+                vals.append(
+                    fn(
+                        *[vals[v] if s else v for s, v in args],
+                        **{k: vals[v] if s else v for k, (s, v) in kwargs.items()}
+                    )
+                )
+            return vals[out_slot]
+
+        if len(conts) == 1:
+            return conts[0].cont_map(lambda x, _: _run([x]), map_sequences=True)
+        return ivy.Container.cont_multi_map(
+            lambda xs, _: _run(list(xs)), conts, map_nests=True
+        )
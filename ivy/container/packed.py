@@ -0,0 +1,224 @@
+"""Containers packed into flat buffers."""
+
+# global
+import operator
+
+# local
+import ivy
+
+
+def _binary_op(op):
+    def _op(self, other):
+        return PackedContainer.map_buffers(op, self, other)
+
+    return _op
+
+
+def _reflected_binary_op(op):
+    def _op(self, other):
+        return PackedContainer.map_buffers(op, other, self)
+
+    return _op
+
+
+def _unary_op(op):
+    def _op(self):
+        return PackedContainer.map_buffers(op, self)
+
+    return _op
+
+
+class PackedContainer:
+    """The array leaves of a container packed into one flat buffer per data type and
+    device, as returned by :meth:`ivy.Container.cont_pack`.
+
+    Elementwise operations on packed containers with the same layout run once per
+    buffer rather than once per leaf, and :meth:`cont_unpack` exposes the leaves again
+    as slices of the buffers, which are views wherever the backend supports them.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1., 2.]), b={'c': ivy.array([[3.]])})
+    >>> y = ivy.Container(a=ivy.array([4., 5.]), b={'c': ivy.array([[6.]])})
+    >>> z = x.cont_pack() * 2 + y.cont_pack()
+    >>> print(z.buffers)
+    [ivy.array([ 6.,  9., 12.])]
+    >>> print(z.cont_unpack())
+    {
+        a: ivy.array([6., 9.]),
+        b: {
+            c: ivy.array([[12.]])
+        }
+    }
+    """
+
+    def __init__(self, buffers, groups, shapes, leaves, treedef, config):
+        # groups holds the indices of the leaves packed into each buffer, in order,
+        # while shapes is None and leaves holds the value for any leaf not packed
+        self.buffers = buffers
+        self._groups = groups
+        self._shapes = shapes
+        self._leaves = leaves
+        self._treedef = treedef
+        self._config = config
+
+    @staticmethod
+    def pack(container: ivy.Container):
+        """Packs the array leaves of a container into flat buffers.
+
+        Parameters
+        ----------
+        container
+            The container to pack.
+
+        Returns
+        -------
+        ret
+            The packed container.
+        """
+        leaves, treedef = ivy.tree_flatten(container.cont_to_dict())
+        groups = dict()
+        shapes = [None] * len(leaves)
+        for i, leaf in enumerate(leaves):
+            if ivy.is_array(leaf):
+                shapes[i] = tuple(leaf.shape)
+                groups.setdefault((ivy.dtype(leaf), ivy.dev(leaf)), []).append(i)
+        groups = tuple(tuple(idxs) for idxs in groups.values())
+        buffers = [
+            ivy.concat([ivy.reshape(leaves[i], (-1,)) for i in idxs])
+            for idxs in groups
+        ]
+        for idxs in groups:
+            for i in idxs:
+                leaves[i] = None
+        return PackedContainer(
+            buffers, groups, tuple(shapes), leaves, treedef, container.cont_config
+        )
+
+    def _same_layout(self, other):
+        return (
+            self._groups == other._groups
+            and self._shapes == other._shapes
+            and self._treedef == other._treedef
+        )
+
+    def _with_buffers(self, buffers):
+        return PackedContainer(
+            buffers,
+            self._groups,
+            self._shapes,
+            self._leaves,
+            self._treedef,
+            self._config,
+        )
+
+    @staticmethod
+    def map_buffers(fn, *args, **kwargs):
+        """Calls a function once per buffer, with each packed container in args and
+        kwargs replaced by the corresponding buffer.
+
+        Parameters
+        ----------
+        fn
+            The function to call, which should be elementwise over the leaves.
+        args
+            The positional arguments, including at least one packed container.
+        kwargs
+            The keyword arguments.
+
+        Returns
+        -------
+        ret
+            A packed container with the same layout for each returned array the size
+            of the buffers, or else the list of the results for each buffer.
+        """
+        packs = [
+            x
+            for x in list(args) + list(kwargs.values())
+            if isinstance(x, PackedContainer)
+        ]
+        ivy.assertions.check_true(
+            len(packs) > 0, message="no packed containers found in arguments"
+        )
+        pack0 = packs[0]
+        for pack in packs[1:]:
+            if not pack0._same_layout(pack):
+                raise ivy.exceptions.IvyException(
+                    "packed containers must have the same layout"
+                )
+
+        rets = []
+        for i in range(len(pack0.buffers)):
+            rets.append(
+                fn(
+                    *[x.buffers[i] if isinstance(x, PackedContainer) else x for x in args],
+                    **{
+                        k: v.buffers[i] if isinstance(v, PackedContainer) else v
+                        for k, v in kwargs.items()
+                    }
+                )
+            )
+
+        def _repack(results):
+            if all(
+                ivy.is_array(r) and tuple(r.shape) == tuple(b.shape)
+                for r, b in zip(results, pack0.buffers)
+            ):
+                return pack0._with_buffers(list(results))
+            return list(results)
+
+        if rets and isinstance(rets[0], tuple):
+            return tuple(_repack(results) for results in zip(*rets))
+        return _repack(rets)
+
+    def cont_unpack(self) -> ivy.Container:
+        """Unpacks the buffers into a container with the structure of the original.
+
+        Returns
+        -------
+        ret
+            The container, with each array leaf a slice of its buffer.
+        """
+        leaves = list(self._leaves)
+        for buffer, idxs in zip(self.buffers, self._groups):
+            sizes = [_size(self._shapes[i]) for i in idxs]
+            for i, x in zip(idxs, ivy.split(buffer, num_or_size_splits=sizes)):
+                leaves[i] = ivy.reshape(x, self._shapes[i])
+        return ivy.Container(ivy.tree_unflatten(self._treedef, leaves), **self._config)
+
+    def __getattr__(self, item):
+        fn = ivy.__dict__.get(item) if not item.startswith("_") else None
+        if not callable(fn):
+            raise AttributeError(
+                "'PackedContainer' object has no attribute '{}'".format(item)
+            )
+
+        def _map(*args, **kwargs):
+            return PackedContainer.map_buffers(fn, self, *args, **kwargs)
+
+        return _map
+
+    def __repr__(self):
+        return "PackedContainer({} leaves in {} buffers)".format(
+            len(self._shapes), len(self.buffers)
+        )
+
+    __add__ = _binary_op(operator.add)
+    __radd__ = _reflected_binary_op(operator.add)
+    __sub__ = _binary_op(operator.sub)
+    __rsub__ = _reflected_binary_op(operator.sub)
+    __mul__ = _binary_op(operator.mul)
+    __rmul__ = _reflected_binary_op(operator.mul)
+    __truediv__ = _binary_op(operator.truediv)
+    __rtruediv__ = _reflected_binary_op(operator.truediv)
+    __pow__ = _binary_op(operator.pow)
+    __rpow__ = _reflected_binary_op(operator.pow)
+    __neg__ = _unary_op(operator.neg)
+    __abs__ = _unary_op(operator.abs)
+
+
+def _size(shape):
+    size = 1
+    for d in shape:
+        size *= d
+    return size
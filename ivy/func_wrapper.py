@@ -4,6 +4,7 @@ import logging
 from types import FunctionType
 from typing import Callable
 import inspect
+from collections import UserDict
 
 
 # for wrapping (sequence matters)
@@ -28,61 +29,109 @@ FN_DECORATORS = [
 # --------#
 
 
-def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
+def _nested_leaves(nest, include_derived=True):
+    # depth-first generator over the leaves of a nest of tuples, lists and dicts,
+    # using an explicit stack and no index paths, so callers can stop at any leaf
+    stack = [nest]
+    while stack:
+        x = stack.pop()
+        if include_derived:
+            if isinstance(x, (tuple, list)):
+                stack.extend(reversed(x))
+                continue
+            if isinstance(x, (dict, UserDict)):
+                stack.extend(reversed(list(x.values())))
+                continue
         else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
-    return arr
+            cls = type(x)
+            if cls is tuple or cls is list:
+                stack.extend(reversed(x))
+                continue
+            if cls is dict:
+                stack.extend(reversed(list(x.values())))
+                continue
+        yield x
+
+
+# python scalars are never arrays in any backend, so they are skipped without calling
+# ivy.is_array on each of them
+_python_scalar_types = {int, float, bool, complex, str, type(None)}
+
+
+def _get_first_array(*args, **kwargs):
+    for x in _nested_leaves((args, kwargs)):
+        if type(x) not in _python_scalar_types and ivy.is_array(x):
+            return x
+    return None
 
 
 # Array Handling #
 # ---------------#
 
 
-def handle_array_like_without_promotion(fn: Callable) -> Callable:
-    @functools.wraps(fn)
-    def new_fn(*args, **kwargs):
-        args = list(args)
-        num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
-
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
+def _is_array_like_annotation(parameter, annotation):
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
+def _get_array_like_indices(fn):
+    # positional indices of the parameters of fn annotated as array-like, along with
+    # the index of an array-like *args parameter, from which all remaining positional
+    # arguments are array-like. These are computed once when wrapping rather than
+    # inspecting the signature on every call
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return (), None
+    indices = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            if _is_array_like_annotation(parameter, param.annotation):
+                return tuple(indices), i
+            break
+        if param.kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
         ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
+            break
+        if _is_array_like_annotation(parameter, param.annotation):
+            indices.append(i)
+    return tuple(indices), None
+
+
+def _handle_array_like(array_like_indices, args):
+    indices, var_positional_index = array_like_indices
+    num_args = len(args)
+    converted = None
+    for i in indices:
+        if i >= num_args:
+            break
+        if not ivy.is_array(args[i]):
+            if converted is None:
+                converted = list(args)
+            converted[i] = ivy.array(args[i])
+    if var_positional_index is not None:
+        for i in range(var_positional_index, num_args):
+            if not ivy.is_array(args[i]):
+                if converted is None:
+                    converted = list(args)
+                converted[i] = ivy.array(args[i])
+    return args if converted is None else converted
+
 
-                if i < num_args:
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(arg):
-                        kwargs[parameter] = ivy.array(kwarg)
+def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    array_like_indices = _get_array_like_indices(fn)
 
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        args = _handle_array_like(array_like_indices, args)
         return fn(*args, **kwargs)
 
     new_fn.handle_array_like_without_promotion = True
@@ -277,6 +326,14 @@ def infer_dtype(fn: Callable) -> Callable:
     return new_fn
 
 
+def _to_float_array(x):
+    if not ivy.is_array(x) or not ivy.is_int_dtype(x.dtype):
+        return x
+    if ivy.is_ivy_array(x):
+        return ivy.asarray(x, dtype=ivy.default_float_dtype())
+    return ivy.native_array(x, dtype=ivy.default_float_dtype(as_native=True))
+
+
 def integer_arrays_to_float(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -299,13 +356,6 @@ def integer_arrays_to_float(fn: Callable) -> Callable:
 
         """
 
-        def _to_float_array(x):
-            if not ivy.is_array(x) or not ivy.is_int_dtype(x.dtype):
-                return x
-            if ivy.is_ivy_array(x):
-                return ivy.asarray(x, dtype=ivy.default_float_dtype())
-            return ivy.native_array(x, dtype=ivy.default_float_dtype(as_native=True))
-
         args = ivy.nested_map(args, _to_float_array, to_mutable=True)
         kwargs = ivy.nested_map(kwargs, _to_float_array, to_mutable=True)
         return fn(*args, **kwargs)
@@ -460,6 +510,265 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Wrapper Compilation #
+# --------------------#
+
+# decorators which _compile_wrapped_function knows how to flatten into a single
+# dispatcher, any other decorator falls back to regular stacking
+COMPILABLE_DECORATORS = (
+    "infer_device",
+    "infer_dtype",
+    "integer_arrays_to_float",
+    "outputs_to_ivy_arrays",
+    "outputs_to_native_arrays",
+    "inputs_to_native_arrays",
+    "inputs_to_ivy_arrays",
+    "handle_out_argument",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+    "handle_array_like_without_promotion",
+)
+
+# snapshot of (array mode, nestable mode, nan policy) read by the compiled
+# dispatchers, refreshed by the setters and unsetters of each of these modes
+_compiled_modes = (True, True, "nothing")
+
+
+def _refresh_compiled_modes():
+    global _compiled_modes
+    _compiled_modes = (
+        ivy.get_array_mode(),
+        ivy.get_nestable_mode(),
+        ivy.get_nan_policy(),
+    )
+
+
+def _is_compilable(decorators):
+    # a mixed function can carry both input conversions, which only have a
+    # well-defined order when stacked
+    return (
+        bool(decorators)
+        and all(attr in COMPILABLE_DECORATORS for attr in decorators)
+        and not (
+            "inputs_to_native_arrays" in decorators
+            and "inputs_to_ivy_arrays" in decorators
+        )
+    )
+
+
+# code objects of the wrappers created by each compilable decorator, used to
+# recognise which decorators a stacked function was built from
+_decorator_codes = dict()
+
+
+def _get_decorator_chain(fn):
+    """Returns the undecorated function at the bottom of the stacked decorators of
+    `fn`, together with the names of these decorators, innermost first. Returns None
+    if `fn` was wrapped by anything else, or if the decorators were not stacked in the
+    order of `FN_DECORATORS`."""
+    if not _decorator_codes:
+
+        def _fn(*args, **kwargs):
+            pass
+
+        for attr in COMPILABLE_DECORATORS:
+            decorator = (
+                output_to_native_arrays
+                if attr == "outputs_to_native_arrays"
+                else getattr(ivy, attr)
+            )
+            _decorator_codes[decorator(_fn).__code__] = attr
+    decorators = list()
+    while hasattr(fn, "__wrapped__"):
+        attr = _decorator_codes.get(getattr(fn, "__code__", None))
+        if attr is None:
+            return None
+        decorators.insert(0, attr)
+        fn = fn.__wrapped__
+    indices = [FN_DECORATORS.index(attr) for attr in decorators]
+    if indices != sorted(set(indices)):
+        return None
+    return fn, decorators
+
+
+class _ContainerFound(Exception):
+    pass
+
+
+def _nest_to_native(x, to_native, nestable):
+    # single pass equivalent of ivy.args_to_native, which also performs the check
+    # ivy.nested_any(x, ivy.is_ivy_container, check_nests=True) when nestable is set
+    if isinstance(x, ivy.Array):
+        return x.data if to_native else x
+    x_type = type(x)
+    if x_type is list:
+        return [_nest_to_native(v, to_native, nestable) for v in x]
+    if x_type is tuple:
+        return tuple([_nest_to_native(v, to_native, nestable) for v in x])
+    if x_type is dict:
+        return {k: _nest_to_native(v, to_native, nestable) for k, v in x.items()}
+    if isinstance(x, ivy.Container):
+        if nestable:
+            raise _ContainerFound
+        return ivy.to_native(x) if to_native else x
+    if (
+        nestable
+        and isinstance(x, (tuple, list, dict))
+        and ivy.nested_any(x, ivy.is_ivy_container, check_nests=True)
+    ):
+        raise _ContainerFound
+    return x
+
+
+def _compile_wrapped_function(fn: Callable, decorators) -> Callable:
+    """Flattens the decorators in `decorators` into a single dispatcher for `fn`,
+    behaving identically to stacking the decorators in the order of `FN_DECORATORS`.
+    The argument tree is only traversed once per call for the container check and the
+    native array conversion, and the global modes are read from a snapshot rather than
+    being queried through their getters on every call.
+
+    Parameters
+    ----------
+    fn
+        the backend function to wrap.
+    decorators
+        the names of the decorators to apply, for which `_is_compilable` must hold.
+
+    Returns
+    -------
+    ret
+        the compiled dispatcher for `fn`.
+    """
+    decorators = set(decorators)
+    array_like = "handle_array_like_without_promotion" in decorators
+    array_like_indices = _get_array_like_indices(fn) if array_like else None
+    nans = "handle_nans" in decorators
+    exceptions = "handle_exceptions" in decorators
+    nestable = "handle_nestable" in decorators
+    out_arg = "handle_out_argument" in decorators
+    native_out = out_arg and hasattr(fn, "support_native_out")
+    in_ivy = "inputs_to_ivy_arrays" in decorators
+    in_native = "inputs_to_native_arrays" in decorators
+    out_native = "outputs_to_native_arrays" in decorators
+    out_ivy = "outputs_to_ivy_arrays" in decorators
+    int_to_float = "integer_arrays_to_float" in decorators
+    dtype_arg = "infer_dtype" in decorators
+    device_arg = "infer_device" in decorators
+    fn_name = fn.__name__
+
+    # the decorators below handle_nestable are stacked for the container fallback,
+    # mapping them to the container leaves exactly as handle_nestable would
+    below_nestable = fn
+    if nestable:
+        for attr in FN_DECORATORS[: FN_DECORATORS.index("handle_nestable")]:
+            if attr in decorators:
+                below_nestable = getattr(ivy, attr)(below_nestable)
+
+    def _call(args, kwargs, array_mode):
+        # everything handled by the decorators inside handle_out_argument
+        if in_ivy:
+            out = kwargs.pop("out") if "out" in kwargs else None
+            args, kwargs = ivy.args_to_ivy(
+                *args, **kwargs, include_derived={tuple: True}
+            )
+            if out is not None:
+                kwargs["out"] = out
+        if int_to_float:
+            args = ivy.nested_map(args, _to_float_array, to_mutable=True)
+            kwargs = ivy.nested_map(kwargs, _to_float_array, to_mutable=True)
+        if dtype_arg:
+            dtype = kwargs.pop("dtype", None)
+            arr = None if dtype is not None else _get_first_array(*args, **kwargs)
+            kwargs["dtype"] = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+        if device_arg:
+            device = kwargs.pop("device", None)
+            arr = None if device is not None else _get_first_array(*args, **kwargs)
+            kwargs["device"] = ivy.default_device(device, item=arr, as_native=True)
+        ret = fn(*args, **kwargs)
+        if out_ivy and array_mode:
+            ret = ivy.to_ivy(
+                ret,
+                nested=isinstance(ret, (tuple, list, dict)),
+                include_derived={tuple: True},
+            )
+        if out_native:
+            ret = ivy.to_native(ret, nested=True, include_derived={tuple: True})
+        return ret
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        array_mode, nestable_mode, nan_policy = _compiled_modes
+        if array_like:
+            args = _handle_array_like(array_like_indices, args)
+        if nans and nan_policy != "nothing":
+            _handle_nan_policy(args, kwargs, nan_policy)
+        try:
+            check_nests = nestable and nestable_mode
+            to_native = in_native and array_mode
+            has_out = "out" in kwargs
+            out = kwargs.pop("out") if has_out else None
+            if check_nests or to_native:
+                try:
+                    new_args = _nest_to_native(args, to_native, check_nests)
+                    new_kwargs = _nest_to_native(kwargs, to_native, check_nests)
+                    if check_nests and out is not None:
+                        _nest_to_native(out, False, True)
+                except _ContainerFound:
+                    if has_out:
+                        kwargs["out"] = out
+                    if hasattr(ivy.Container, "static_" + fn_name):
+                        return getattr(ivy.Container, "static_" + fn_name)(
+                            *args, **kwargs
+                        )
+                    return ivy.Container.cont_multi_map_in_function(
+                        below_nestable, *args, **kwargs
+                    )
+            else:
+                new_args, new_kwargs = args, kwargs
+            if not out_arg:
+                if has_out:
+                    new_kwargs["out"] = out
+                return _call(new_args, new_kwargs, array_mode)
+            if out is None:
+                return _call(new_args, new_kwargs, array_mode)
+            if native_out:
+                # compute return, with backend inplace update handled by
+                # the backend function
+                new_kwargs["out"] = ivy.to_native(out)
+                ret = _call(new_args, new_kwargs, array_mode)
+                if isinstance(ret, (tuple, list)):
+                    for i in range(len(ret)):
+                        out[i].data = ivy.to_native(ret[i])
+                else:
+                    out.data = ivy.to_native(ret)
+                return out
+            # compute return, and then handle the inplace update explicitly
+            ret = _call(new_args, new_kwargs, array_mode)
+            if not ivy.is_array(ret) and not ivy.is_ivy_container(ret):
+                return ivy.nested_multi_map(
+                    lambda x, _: ivy.inplace_update(
+                        x[0], ivy.astype(x[1], ivy.dtype(x[0]))
+                    ),
+                    [out, ret],
+                )
+            return ivy.inplace_update(out, ivy.astype(ret, ivy.dtype(out)))
+        except (IndexError, ValueError, AttributeError) as e:
+            if not exceptions:
+                raise
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyError(fn_name, str(e))
+        except Exception as e:
+            if not exceptions:
+                raise
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+
+    for attr in decorators:
+        setattr(new_fn, attr, True)
+    return new_fn
+
+
 # Functions #
 
 
@@ -527,9 +836,27 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        if _is_compilable(decorators):
+            return _compile_wrapped_function(to_wrap, decorators)
+        if compositional and not decorators:
+            # the ivy implementation was decorated at import time, so its stacked
+            # decorators are flattened into a dispatcher around the undecorated
+            # implementation instead, provided they were stacked in the order of
+            # FN_DECORATORS, otherwise the import time stack is kept as it is
+            chain = _get_decorator_chain(to_wrap)
+            if chain is not None and _is_compilable(chain[1]):
+                compiled = _compile_wrapped_function(*chain)
+                for attr, value in to_wrap.__dict__.items():
+                    if attr != "__wrapped__":
+                        setattr(compiled, attr, value)
+                return compiled
+        for attr in decorators:
+            to_wrap = getattr(ivy, attr)(to_wrap)
     return to_wrap
 
 
@@ -663,6 +990,20 @@ def _nest_has_nans(x):
     return ivy.nested_any(x, _leaf_has_nans)
 
 
+def _handle_nan_policy(args, kwargs, nan_policy):
+    # check all args and kwards for presence of nans
+    result = _nest_has_nans(args) or _nest_has_nans(kwargs)
+
+    if result:
+        # handle nans based on the selected policy
+        if nan_policy == "raise_exception":
+            raise ivy.exceptions.IvyException(
+                "Nans are not allowed in `raise_exception` policy."
+            )
+        elif nan_policy == "warns":
+            logging.warning("Nans are present in the input.")
+
+
 def handle_nans(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -690,21 +1031,8 @@ def handle_nans(fn: Callable) -> Callable:
         """
         nan_policy = ivy.get_nan_policy()
         # skip the check if the current nan policy is `nothing``
-        if nan_policy == "nothing":
-            return fn(*args, **kwargs)
-
-        # check all args and kwards for presence of nans
-        result = _nest_has_nans(args) or _nest_has_nans(kwargs)
-
-        if result:
-            # handle nans based on the selected policy
-            if nan_policy == "raise_exception":
-                raise ivy.exceptions.IvyException(
-                    "Nans are not allowed in `raise_exception` policy."
-                )
-            elif nan_policy == "warns":
-                logging.warning("Nans are present in the input.")
-
+        if nan_policy != "nothing":
+            _handle_nan_policy(args, kwargs, nan_policy)
         return fn(*args, **kwargs)
 
     new_fn.handle_nans = True
@@ -231,9 +231,9 @@ def divide(
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     ret = np.divide(x1, x2, out=out)
     if ivy.is_float_dtype(x1):
-        ret = np.asarray(ret, dtype=x1.dtype)
+        ret = np.asanyarray(ret, dtype=x1.dtype)
     else:
-        ret = np.asarray(ret, dtype=ivy.default_float_dtype(as_native=True))
+        ret = np.asanyarray(ret, dtype=ivy.default_float_dtype(as_native=True))
     return ret
 
 
@@ -554,9 +554,9 @@ def remainder(
     if not modulus:
         res = x1 / x2
         res_floored = np.where(res >= 0, np.floor(res), np.ceil(res))
-        diff = np.asarray(res - res_floored, dtype=res.dtype)
+        diff = np.asanyarray(res - res_floored, dtype=res.dtype)
         diff, x2 = ivy.promote_types_of_inputs(diff, x2)
-        return np.asarray(np.round(diff * x2), dtype=x1.dtype)
+        return np.asanyarray(np.round(diff * x2), dtype=x1.dtype)
     return np.remainder(x1, x2, out=out)
 
 
@@ -686,7 +686,7 @@ def erf(x, /, *, out: Optional[np.ndarray] = None):
     y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * np.exp(-x * x)
     ret = sign * y
     if hasattr(x, "dtype"):
-        ret = np.asarray(ret, dtype=x.dtype)
+        ret = np.asanyarray(ret, dtype=x.dtype)
     if ivy.exists(out):
         return ivy.inplace_update(out, ret)
     return ret
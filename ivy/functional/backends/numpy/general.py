@@ -11,6 +11,7 @@ from numbers import Number
 # local
 import ivy
 from ivy.functional.backends.numpy.device import _to_device
+from ivy.functional.backends.numpy.helpers import _BatchedArray, _batch, _unbatch
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray, /) -> bool:
@@ -58,24 +59,37 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+        return _to_device(np.take(params, indices, axis))
+    # fold the batch dims and the dims before axis into flat offsets, such that all
+    # batch elements are gathered with a single take
+    batch_shape = params.shape[:batch_dims]
+    num_batches = reduce(mul, batch_shape, 1)
+    num_leading = reduce(mul, params.shape[batch_dims:axis], 1)
+    axis_size = params.shape[axis]
+    indices_shape = np.shape(indices)
+    num_indices = reduce(mul, indices_shape[batch_dims:], 1)
+    indices = np.reshape(indices, (num_batches, 1, num_indices))
+    indices = np.where(indices < 0, indices + axis_size, indices)
+    if indices.size and (indices.min() < 0 or indices.max() >= axis_size):
+        raise IndexError(
+            "index out of bounds for axis {} with size {}".format(axis, axis_size)
+        )
+    offsets = (
+        np.arange(num_batches * num_leading).reshape((num_batches, num_leading, 1))
+        * axis_size
+        + indices
+    )
+    flat_params = np.reshape(
+        params, (num_batches * num_leading * axis_size,) + params.shape[axis + 1 :]
+    )
+    result = np.take(flat_params, offsets, 0)
+    return _to_device(
+        np.reshape(
+            result,
+            params.shape[:axis] + indices_shape[batch_dims:] + params.shape[axis + 1 :],
+        )
+    )
 
 
 def gather_nd_helper(params, indices):
@@ -119,24 +133,32 @@ def gather_nd(
 ) -> np.ndarray:
     ivy.assertions.check_gather_nd_input_valid(params, indices, batch_dims)
     batch_dims = batch_dims % len(params.shape)
-    result = []
     if batch_dims == 0:
-        result = gather_nd_helper(params, indices)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = gather_nd_helper(p, np.asarray(i, indices.dtype))
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+        return _to_device(gather_nd_helper(params, indices))
+    # fold the batch dims and the indexed dims into flat offsets, such that all batch
+    # elements are gathered with a single take
+    batch_shape = params.shape[:batch_dims]
+    num_batches = reduce(mul, batch_shape, 1)
+    indices_shape = np.shape(indices)
+    num_index_dims = indices_shape[-1]
+    indexed_shape = params.shape[batch_dims : batch_dims + num_index_dims]
+    num_indices = reduce(mul, indices_shape[batch_dims:-1], 1)
+    indices = np.reshape(indices, (num_batches, num_indices, num_index_dims))
+    indices = np.where(indices < 0, indices + np.array(indexed_shape), indices)
+    offsets = np.ravel_multi_index(tuple(np.moveaxis(indices, -1, 0)), indexed_shape)
+    num_indexed = reduce(mul, indexed_shape, 1)
+    offsets += np.arange(num_batches).reshape((num_batches, 1)) * num_indexed
+    flat_params = np.reshape(
+        params,
+        (num_batches * num_indexed,) + params.shape[batch_dims + num_index_dims :],
+    )
+    result = np.take(flat_params, offsets, 0)
+    return _to_device(
+        np.reshape(
+            result,
+            indices_shape[:-1] + params.shape[batch_dims + num_index_dims :],
+        )
+    )
 
 
 def get_num_dims(x, /, *, as_array=False):
@@ -217,6 +239,74 @@ def multiprocessing(context=None):
     )
 
 
+_SCATTER_REDUCTIONS = {"sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+def _check_scatter_reduction(reduction):
+    if reduction not in _SCATTER_REDUCTIONS and reduction != "replace":
+        raise ivy.exceptions.IvyException(
+            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
+                reduction
+            )
+        )
+
+
+def _scatter_identity(ufunc, dtype):
+    if ufunc is np.add:
+        return 0
+    if dtype.kind == "b":
+        return ufunc is np.minimum
+    if dtype.kind == "f":
+        return np.inf if ufunc is np.minimum else -np.inf
+    info = np.iinfo(dtype)
+    return info.max if ufunc is np.minimum else info.min
+
+
+def _scatter_into(target, offsets, updates, reduction, target_given):
+    # scatters the rows of updates into the rows of target in place. The offsets are
+    # sorted and segmented, so that each reduction is a single buffered reduceat over
+    # the updates, and only the rows which are hit are read and written
+    if reduction == "replace":
+        target[offsets] = updates
+        return
+    if not offsets.size:
+        return
+    if reduction == "sum" and updates.dtype.kind == "f":
+        # float sums need no sorting, they are accumulated by bincount in float64
+        row_size = updates[0].size
+        bins = offsets.reshape((-1, 1)) * row_size + np.arange(row_size)
+        sums = np.bincount(
+            bins.reshape((-1,)), updates.reshape((-1,)), target.shape[0] * row_size
+        )
+        target += sums.reshape(target.shape)
+        return
+    ufunc = _SCATTER_REDUCTIONS[reduction]
+    unsorted = np.any(offsets[1:] < offsets[:-1])
+    if unsorted and updates.ndim == 1 and updates.dtype.kind in "biuf":
+        # unsorted scalar updates are cheaper to scatter unbuffered than to sort,
+        # starting from the identity of the reduction for the dtype
+        scattered = np.full(
+            target.shape, _scatter_identity(ufunc, updates.dtype), updates.dtype
+        )
+        ufunc.at(scattered, offsets, updates)
+        if not target_given:
+            rows = np.bincount(offsets, minlength=target.shape[0]) > 0
+            target[rows] = scattered[rows]
+        else:
+            target[...] = ufunc(target, scattered)
+        return
+    if unsorted:
+        order = np.argsort(offsets)
+        offsets = offsets[order]
+        updates = np.take(updates, order, 0)
+    starts = np.flatnonzero(np.concatenate([[True], offsets[1:] != offsets[:-1]]))
+    rows = offsets[starts]
+    reduced = ufunc.reduceat(updates, starts, axis=0)
+    if target_given:
+        reduced = ufunc(target[rows], reduced)
+    target[rows] = reduced
+
+
 def scatter_flat(
     indices: np.ndarray,
     updates: np.ndarray,
@@ -231,38 +321,21 @@ def scatter_flat(
     if ivy.exists(size) and ivy.exists(target):
         ivy.assertions.check_equal(len(target.shape), 1)
         ivy.assertions.check_equal(target.shape[0], size)
-    if reduction == "sum":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        np.add.at(target, indices, updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * 1e12
-        np.minimum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == 1e12, 0.0, target), dtype=updates.dtype
-            )
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == -1e12, 0.0, target), dtype=updates.dtype
-            )
+    _check_scatter_reduction(reduction)
+    updates = np.asarray(updates)
+    if not target_given:
+        target = np.zeros([size], dtype=updates.dtype)
     else:
-        raise ivy.exceptions.IvyException(
-            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
-                reduction
-            )
-        )
+        target = ivy.to_native(target)
+        if not target.flags.writeable:
+            target = target.copy()
+    size = target.shape[0]
+    offsets = np.reshape(indices, (-1,))
+    offsets = np.where(offsets < 0, offsets + size, offsets)
+    if offsets.size and (offsets.min() < 0 or offsets.max() >= size):
+        raise IndexError("index out of bounds for axis 0 with size {}".format(size))
+    updates = np.broadcast_to(updates, np.shape(indices)).reshape((-1,))
+    _scatter_into(target, offsets, updates, reduction, target_given)
     return _to_device(target)
 
 
@@ -280,6 +353,7 @@ def scatter_nd(
     if ivy.exists(shape) and target_given:
         ivy.assertions.check_equal(ivy.Shape(target.shape), ivy.Shape(shape))
     shape = list(shape) if ivy.exists(shape) else list(out.shape)
+    _check_scatter_reduction(reduction)
     if indices is not Ellipsis and (
         isinstance(indices, (tuple, list)) and not (Ellipsis in indices)
     ):
@@ -298,39 +372,34 @@ def scatter_nd(
             indices = ivy.broadcast_to(
                 indices, updates.shape[:1] + (indices.shape[-1],)
             )._data
-    indices_flat = indices.reshape(-1, indices.shape[-1]).T
-    indices_tuple = tuple(indices_flat) + (Ellipsis,)
-    if reduction == "sum":
-        if not target_given:
-            target = np.zeros(shape, dtype=updates.dtype)
-        np.add.at(target, indices_tuple, updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = np.zeros(shape, dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices_tuple] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones(shape) * 1e12
-        np.minimum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == 1e12, 0, target)
-            target = np.asarray(target, dtype=updates.dtype)
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones(shape, dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == -1e12, 0.0, target)
-            target = np.asarray(target, dtype=updates.dtype)
+    updates = np.asarray(updates)
+    if not target_given:
+        target = np.zeros(shape, dtype=updates.dtype)
     else:
-        raise ivy.exceptions.IvyException(
-            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
-                reduction
-            )
-        )
-    if ivy.exists(out):
+        target = ivy.to_native(target)
+        if not target.flags.writeable:
+            target = target.copy()
+    # fold the indexed dims into flat row offsets of a view of the target, with the
+    # remaining dims forming the rows which are scattered
+    num_index_dims = indices.shape[-1]
+    indexed_shape = tuple(shape[:num_index_dims])
+    slice_shape = tuple(shape[num_index_dims:])
+    indices = np.reshape(indices, (-1, num_index_dims))
+    indices = np.where(indices < 0, indices + np.array(indexed_shape), indices)
+    if num_index_dims:
+        offsets = np.ravel_multi_index(tuple(indices.T), indexed_shape)
+    else:
+        offsets = np.zeros(indices.shape[:1], dtype=np.int64)
+    updates = np.broadcast_to(updates, indices.shape[:1] + slice_shape)
+    # reshaping only copies the target if it is not contiguous
+    target_contiguous = target.flags.c_contiguous
+    flat_target = np.reshape(target, (-1,) + slice_shape)
+    _scatter_into(flat_target, offsets, updates, reduction, target_given)
+    if not target_contiguous:
+        target = np.reshape(flat_target, shape)
+    if target_given:
+        if target is ivy.to_native(out):
+            return out
         return ivy.inplace_update(out, _to_device(target))
     return _to_device(target)
 
@@ -345,17 +414,63 @@ def shape(x: np.ndarray, /, *, as_array: bool = False) -> Union[ivy.Shape, ivy.A
         return ivy.Shape(x.shape)
 
 
+def _vmap_outputs(ret):
+    ret = ivy.to_native(ret, nested=True)
+    return list(ret) if isinstance(ret, (tuple, list)) else [ret]
+
+
+def _vmap_batched(func, args, mapped, batch_size):
+    # run func once on the whole batch, with the mapped args presenting themselves
+    # as single examples, and the batching rules of _BatchedArray handling the
+    # batch axis of every operation
+    ret = func(*[_batch(a) if m else a for a, m in zip(args, mapped)])
+    return [
+        _unbatch(r)
+        if isinstance(r, _BatchedArray)
+        else np.broadcast_to(r, (batch_size,) + np.shape(r)).copy()
+        for r in _vmap_outputs(ret)
+    ], isinstance(ret, (tuple, list))
+
+
+def _vmap_looped(func, args, mapped, batch_size):
+    rets = [
+        func(*[a[i] if m else a for a, m in zip(args, mapped)])
+        for i in range(batch_size)
+    ]
+    is_sequence = isinstance(rets[0], (tuple, list))
+    return [np.stack(r) for r in zip(*map(_vmap_outputs, rets))], is_sequence
+
+
+def _vmap_matches_example(func, args, mapped, rets):
+    # check the batched results against func applied to the first example, which
+    # guards against operations that silently bypass the batching rules
+    example_args = [a[0] if m else a for a, m in zip(args, mapped)]
+    example_rets = _vmap_outputs(func(*example_args))
+    if len(example_rets) != len(rets):
+        return False
+    for ret, example_ret in zip(rets, example_rets):
+        example_ret = np.asarray(example_ret)
+        if ret.shape[1:] != example_ret.shape or ret.dtype != example_ret.dtype:
+            return False
+        if ret.dtype.kind in "fc":
+            if not np.allclose(ret[0], example_ret, equal_nan=True):
+                return False
+        elif not np.array_equal(ret[0], example_ret):
+            return False
+    return True
+
+
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: Optional[int] = 0,
 ) -> Callable:
+    # whether func can be batched, for each signature of the args it was called with
+    batchable = dict()
+
     @ivy.to_native_arrays_and_back
     def _vmap(*args):
 
-        # convert args tuple to list to allow mutability using moveaxis ahead.
-        args = list(args)
-
         # if in_axis is a non-integer, its length should be equal to pos args.
         if isinstance(in_axes, (list, tuple)):
             ivy.assertions.check_equal(
@@ -393,37 +508,39 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+        axes = in_axes if isinstance(in_axes, (list, tuple)) else [in_axes] * len(args)
+        mapped = [axis is not None for axis in axes]
+        args = [
+            np.moveaxis(arg, axis, 0) if axis is not None else arg
+            for arg, axis in zip(args, axes)
+        ]
+        batch_size = axis_size.pop()
+
+        # vectorisation, falling back to mapping func in a loop if any operation has
+        # no batching rule, or if the batched results do not match the first example
+        signature = tuple(
+            (np.shape(arg), np.result_type(arg), m) for arg, m in zip(args, mapped)
+        )
+        rets = None
+        if batchable.get(signature, True):
+            try:
+                rets, is_sequence = _vmap_batched(func, args, mapped, batch_size)
+                if signature not in batchable:
+                    batchable[signature] = _vmap_matches_example(
+                        func, args, mapped, rets
+                    )
+                    if not batchable[signature]:
+                        rets = None
+            except Exception:
+                batchable[signature] = False
+                rets = None
+        if rets is None:
+            rets, is_sequence = _vmap_looped(func, args, mapped, batch_size)
 
         if out_axes:
-            res = np.moveaxis(res, 0, out_axes)
+            rets = [np.moveaxis(ret, 0, out_axes) for ret in rets]
 
-        return res
+        return tuple(rets) if is_sequence else rets[0]
 
     return _vmap
@@ -17,3 +17,427 @@ def _scalar_output_to_0d_array(function: Callable) -> Callable:
         return np.asarray(ret) if np.isscalar(ret) else ret
 
     return new_function
+
+
+# Batching #
+# -------- #
+
+
+class _Unbatchable(Exception):
+    """Raised for operations on batched arrays without a batching rule, such that
+    vmap falls back to mapping the function over the batch in a loop."""
+
+
+def _unbatch(x):
+    return x.view(np.ndarray) if isinstance(x, _BatchedArray) else x
+
+
+def _batch(x):
+    return np.asarray(x).view(_BatchedArray)
+
+
+def _example_ndim(x):
+    return x.ndim if isinstance(x, _BatchedArray) else np.ndim(x)
+
+
+def _example_axis(axis, ndim):
+    # position of a per-example axis in the batched array
+    if not -ndim <= axis < ndim:
+        raise _Unbatchable("axis {} is out of bounds".format(axis))
+    return axis % ndim + 1
+
+
+def _example_axes(axis, ndim):
+    if axis is None:
+        return tuple(range(1, ndim + 1))
+    if isinstance(axis, (tuple, list)):
+        return tuple(_example_axis(a, ndim) for a in axis)
+    return _example_axis(axis, ndim)
+
+
+def _align(args):
+    # give all batched args the same number of dims behind the batch axis, such that
+    # broadcasting with the unbatched args lines up as it does for a single example
+    ndim = max(_example_ndim(a) for a in args)
+    return [
+        _unbatch(a).reshape((a.batch_size,) + (1,) * (ndim - a.ndim) + a.shape)
+        if isinstance(a, _BatchedArray)
+        else a
+        for a in args
+    ]
+
+
+def _batched_key(key):
+    if not isinstance(key, tuple):
+        key = (key,)
+    if any(isinstance(k, _BatchedArray) for k in key):
+        raise _Unbatchable("indexing with batched indices")
+    # advanced indices must be adjacent, so numpy keeps their dims after the batch
+    # axis rather than moving them in front of it
+    if any(isinstance(k, (list, np.ndarray)) for k in key):
+        advanced = [
+            i
+            for i, k in enumerate(key)
+            if isinstance(k, (list, np.ndarray, int, np.integer))
+        ]
+        if advanced != list(range(advanced[0], advanced[-1] + 1)):
+            raise _Unbatchable("non-adjacent advanced indices")
+    if any(isinstance(k, (bool, np.bool_)) for k in key):
+        raise _Unbatchable("indexing with boolean scalars")
+    return (slice(None),) + key
+
+
+def _batched_matmul(x1, x2, **kwargs):
+    ndims = [_example_ndim(x1), _example_ndim(x2)]
+    if not all(ndims):
+        raise _Unbatchable("matmul with scalars")
+    batch_size = (x1 if isinstance(x1, _BatchedArray) else x2).batch_size
+    raw = [_unbatch(x1), _unbatch(x2)]
+    squeeze_axes = []
+    # vectors are promoted to matrices, as matmul does for a single example
+    if ndims[0] == 1:
+        raw[0] = np.expand_dims(raw[0], -2)
+        squeeze_axes.append(-2)
+    if ndims[1] == 1:
+        raw[1] = np.expand_dims(raw[1], -1)
+        squeeze_axes.append(-1)
+    ndims = [max(ndim, 2) for ndim in ndims]
+    for i, x in enumerate([x1, x2]):
+        if isinstance(x, _BatchedArray):
+            raw[i] = raw[i].reshape(
+                (batch_size,) + (1,) * (max(ndims) - ndims[i]) + raw[i].shape[1:]
+            )
+    ret = np.matmul(*raw, **kwargs)
+    return _batch(np.squeeze(ret, tuple(squeeze_axes)) if squeeze_axes else ret)
+
+
+def _batched_concatenate(arrays, axis=0, out=None, **kwargs):
+    if out is not None:
+        raise _Unbatchable("concatenate with out")
+    arrays = list(arrays)
+    batch_size = next(a for a in arrays if isinstance(a, _BatchedArray)).batch_size
+    if axis is None:
+        arrays = [np.ravel(a) for a in arrays]
+        axis = 0
+    axis = _example_axis(axis, _example_ndim(arrays[0]))
+    arrays = [
+        _unbatch(a)
+        if isinstance(a, _BatchedArray)
+        else np.broadcast_to(a, (batch_size,) + np.shape(a))
+        for a in arrays
+    ]
+    return _batch(np.concatenate(arrays, axis, **kwargs))
+
+
+def _batched_where(condition, x=None, y=None):
+    if x is None or y is None:
+        raise _Unbatchable("where without x and y")
+    return _batch(np.where(*_align([condition, x, y])))
+
+
+def _batched_einsum(subscripts, *operands, **kwargs):
+    if not isinstance(subscripts, str) or "->" not in subscripts:
+        raise _Unbatchable("einsum without explicit output subscripts")
+    if kwargs.get("out") is not None:
+        raise _Unbatchable("einsum with out")
+    inputs, output = subscripts.replace(" ", "").split("->")
+    # index the batch axis with a letter which is not used by the subscripts
+    letter = next(c for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if c not in subscripts)
+    inputs = [
+        letter + s if isinstance(op, _BatchedArray) else s
+        for s, op in zip(inputs.split(","), operands)
+    ]
+    return _batch(
+        np.einsum(
+            ",".join(inputs) + "->" + letter + output,
+            *[_unbatch(op) for op in operands],
+            **kwargs,
+        )
+    )
+
+
+def _batched_tensordot(a, b, axes=2):
+    # express the contraction as an einsum, which then batches the operands
+    ndims = [_example_ndim(a), _example_ndim(b)]
+    if isinstance(axes, int):
+        axes = [list(range(ndims[0] - axes, ndims[0])), list(range(axes))]
+    axes = [
+        [ax % ndim for ax in ([x] if isinstance(x, int) else x)]
+        for x, ndim in zip(axes, ndims)
+    ]
+    letters = iter("abcdefghijklmnopqrstuvwxyz")
+    subscripts = [[next(letters) for _ in range(ndim)] for ndim in ndims]
+    for i, j in zip(*axes):
+        subscripts[1][j] = subscripts[0][i]
+    output = [c for i, c in enumerate(subscripts[0]) if i not in axes[0]] + [
+        c for j, c in enumerate(subscripts[1]) if j not in axes[1]
+    ]
+    return _batched_einsum(
+        "{},{}->{}".format(*["".join(sub) for sub in subscripts + [output]]), a, b
+    )
+
+
+def _batched_broadcast_to(array, shape, subok=False):
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    if len(shape) < array.ndim:
+        raise _Unbatchable("broadcast to fewer dims")
+    raw = _unbatch(array).reshape(
+        (array.batch_size,) + (1,) * (len(shape) - array.ndim) + array.shape
+    )
+    return _batch(np.broadcast_to(raw, (array.batch_size,) + shape))
+
+
+def _batched_like(fn):
+    def _like(a, *args, shape=None, **kwargs):
+        if shape is not None:
+            raise _Unbatchable("{} with shape".format(fn.__name__))
+        return _batch(fn(_unbatch(a), *args, **kwargs))
+
+    return _like
+
+
+# numpy functions with a batching rule
+_BATCHING_RULES = {
+    np.concatenate: _batched_concatenate,
+    np.where: _batched_where,
+    np.einsum: _batched_einsum,
+    np.tensordot: _batched_tensordot,
+    np.broadcast_to: _batched_broadcast_to,
+    np.copy: lambda a, *_, **__: _batch(_unbatch(a).copy()),
+    np.zeros_like: _batched_like(np.zeros_like),
+    np.ones_like: _batched_like(np.ones_like),
+    np.empty_like: _batched_like(np.empty_like),
+    np.full_like: _batched_like(np.full_like),
+}
+
+# numpy functions implemented in Python on top of array methods, ufuncs and other
+# dispatched functions, which therefore batch through those
+_BATCHED_BY_IMPLEMENTATION = {
+    np.expand_dims,
+    np.moveaxis,
+    np.swapaxes,
+    np.transpose,
+    np.reshape,
+    np.squeeze,
+    np.ravel,
+    np.stack,
+    np.shape,
+    np.ndim,
+    np.size,
+    np.sum,
+    np.prod,
+    np.max,
+    np.min,
+    np.amax,
+    np.amin,
+    np.any,
+    np.all,
+    np.mean,
+    np.std,
+    np.var,
+    np.clip,
+    np.take,
+    np.argmax,
+    np.argmin,
+    np.cumsum,
+    np.cumprod,
+    np.sort,
+    np.argsort,
+}
+
+
+def _unbatchable_method(name):
+    def _method(self, *args, **kwargs):
+        raise _Unbatchable("ndarray.{}".format(name))
+
+    return _method
+
+
+class _BatchedArray(np.ndarray):
+    """Numpy array with a leading batch axis, which presents itself as a single
+    example. The shape and all supported operations refer to the example dims, and
+    operations without a batching rule raise _Unbatchable.
+    """
+
+    @property
+    def batch_size(self):
+        return _unbatch(self).shape[0]
+
+    @property
+    def shape(self):
+        return _unbatch(self).shape[1:]
+
+    @property
+    def ndim(self):
+        return _unbatch(self).ndim - 1
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def __len__(self):
+        if not self.ndim:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, key):
+        return _batch(_unbatch(self)[_batched_key(key)])
+
+    def __setitem__(self, key, value):
+        key = _batched_key(key)
+        raw = _unbatch(self)
+        if isinstance(value, _BatchedArray):
+            ndim = raw[key].ndim - 1
+            value = _unbatch(value).reshape(
+                (value.batch_size,) + (1,) * (ndim - value.ndim) + value.shape
+            )
+        raw[key] = value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.pop("out", None)
+        if out is not None:
+            if not all(isinstance(o, _BatchedArray) for o in out):
+                raise _Unbatchable("{} with unbatched out".format(ufunc.__name__))
+            kwargs["out"] = tuple(_unbatch(o) for o in out)
+        if kwargs.get("where", True) is not True:
+            raise _Unbatchable("{} with where".format(ufunc.__name__))
+        if method == "__call__":
+            if ufunc is np.matmul and out is None:
+                return _batched_matmul(*inputs, **kwargs)
+            if ufunc.signature is not None:
+                raise _Unbatchable(ufunc.__name__)
+            ret = ufunc(*_align(inputs), **kwargs)
+        elif method in ("reduce", "accumulate") and len(inputs) == 1:
+            (x,) = inputs
+            axis = kwargs.pop("axis", 0)
+            if method == "accumulate" and axis is None:
+                raise _Unbatchable("accumulate without axis")
+            ret = getattr(ufunc, method)(
+                _unbatch(x), axis=_example_axes(axis, x.ndim), **kwargs
+            )
+        else:
+            raise _Unbatchable("{}.{}".format(ufunc.__name__, method))
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(ret, tuple):
+            return tuple(_batch(r) for r in ret)
+        return _batch(ret)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func in _BATCHING_RULES:
+            return _BATCHING_RULES[func](*args, **kwargs)
+        if func in _BATCHED_BY_IMPLEMENTATION:
+            return func._implementation(*args, **kwargs)
+        raise _Unbatchable(func.__name__)
+
+    def reshape(self, *shape, order="C"):
+        if len(shape) == 1 and not isinstance(shape[0], int):
+            shape = shape[0]
+        return _batch(
+            _unbatch(self).reshape((self.batch_size,) + tuple(shape), order=order)
+        )
+
+    def transpose(self, *axes):
+        if len(axes) == 1 and not isinstance(axes[0], int):
+            axes = axes[0]
+        if axes is None or not len(axes):
+            axes = tuple(range(self.ndim - 1, -1, -1))
+        return _batch(
+            _unbatch(self).transpose((0,) + _example_axes(tuple(axes), self.ndim))
+        )
+
+    def swapaxes(self, axis1, axis2):
+        return _batch(
+            _unbatch(self).swapaxes(
+                _example_axis(axis1, self.ndim), _example_axis(axis2, self.ndim)
+            )
+        )
+
+    def squeeze(self, axis=None):
+        if axis is None:
+            axis = tuple(i for i, size in enumerate(self.shape) if size == 1)
+        return _batch(_unbatch(self).squeeze(_example_axes(axis, self.ndim)))
+
+    def ravel(self, order="C"):
+        return _batch(_unbatch(self).reshape((self.batch_size, -1), order=order))
+
+    def flatten(self, order="C"):
+        return self.ravel(order).copy()
+
+    def take(self, indices, axis=None, out=None, mode="raise"):
+        if isinstance(indices, _BatchedArray) or out is not None:
+            raise _Unbatchable("take with batched indices or out")
+        if axis is None:
+            return _batch(self.ravel().view(np.ndarray).take(indices, 1, mode=mode))
+        axis = _example_axis(axis, self.ndim)
+        return _batch(_unbatch(self).take(indices, axis, mode=mode))
+
+    def _arg_reduce(self, name, axis=None, out=None, **kwargs):
+        if out is not None:
+            raise _Unbatchable("{} with out".format(name))
+        if axis is None:
+            keepdims = kwargs.pop("keepdims", False)
+            ret = getattr(_unbatch(self.ravel()), name)(1, **kwargs)
+            if keepdims:
+                ret = ret.reshape((self.batch_size,) + (1,) * self.ndim)
+            return _batch(ret)
+        axis = _example_axis(axis, self.ndim)
+        return _batch(getattr(_unbatch(self), name)(axis, **kwargs))
+
+    def argmax(self, axis=None, out=None, **kwargs):
+        return self._arg_reduce("argmax", axis, out, **kwargs)
+
+    def argmin(self, axis=None, out=None, **kwargs):
+        return self._arg_reduce("argmin", axis, out, **kwargs)
+
+    def argsort(self, axis=-1, kind=None, order=None):
+        return self._arg_reduce("argsort", axis, kind=kind, order=order)
+
+    def cumsum(self, axis=None, dtype=None, out=None):
+        return self._arg_reduce("cumsum", axis, out, dtype=dtype)
+
+    def cumprod(self, axis=None, dtype=None, out=None):
+        return self._arg_reduce("cumprod", axis, out, dtype=dtype)
+
+    def sort(self, axis=-1, kind=None, order=None):
+        if axis is None:
+            raise _Unbatchable("sort without axis")
+        _unbatch(self).sort(_example_axis(axis, self.ndim), kind=kind, order=order)
+
+
+# data dependent or layout specific methods, which have no batching rule
+for _name in [
+    "__bool__",
+    "__int__",
+    "__float__",
+    "__complex__",
+    "__index__",
+    "item",
+    "itemset",
+    "tolist",
+    "tobytes",
+    "tofile",
+    "dot",
+    "diagonal",
+    "trace",
+    "choose",
+    "compress",
+    "nonzero",
+    "searchsorted",
+    "repeat",
+    "resize",
+    "put",
+    "partition",
+    "argpartition",
+    "round",
+    "byteswap",
+    "fill",
+]:
+    setattr(_BatchedArray, _name, _unbatchable_method(_name))
@@ -240,7 +240,7 @@ def clip(
     ivy.assertions.check_less(
         ivy.array(x_min), ivy.array(x_max), message="min values must be less than max"
     )
-    return np.asarray(np.clip(x, x_min, x_max, out=out), dtype=x.dtype)
+    return np.asanyarray(np.clip(x, x_min, x_max, out=out), dtype=x.dtype)
 
 
 clip.support_native_out = True
@@ -28,7 +28,7 @@ def argmax(
         else:
             ret = np.array(x.size - ret - 1)
     else:
-        ret = np.array(np.argmax(x, axis=axis, keepdims=keepdims))
+        ret = np.asanyarray(np.argmax(x, axis=axis, keepdims=keepdims))
     if dtype:
         dtype = ivy.as_native_dtype(dtype)
         ret = ret.astype(dtype)
@@ -53,7 +53,7 @@ def argmin(
         else:
             ret = np.array(x.size - ret - 1)
     else:
-        ret = np.array(np.argmin(x, axis=axis, keepdims=keepdims))
+        ret = np.asanyarray(np.argmin(x, axis=axis, keepdims=keepdims))
     if output_dtype:
         output_dtype = ivy.as_native_dtype(output_dtype)
         return ret.astype(output_dtype)
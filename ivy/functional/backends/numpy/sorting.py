@@ -30,9 +30,9 @@ def sort(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     kind = "stable" if stable else "quicksort"
-    ret = np.asarray(np.sort(x, axis=axis, kind=kind))
+    ret = np.asanyarray(np.sort(x, axis=axis, kind=kind))
     if descending:
-        ret = np.asarray((np.flip(ret, axis)))
+        ret = np.asanyarray((np.flip(ret, axis)))
     return ret
 
 
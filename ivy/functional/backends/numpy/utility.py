@@ -11,7 +11,7 @@ def all(
     keepdims: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return np.asarray(np.all(x, axis=axis, keepdims=keepdims, out=out))
+    return np.asanyarray(np.all(x, axis=axis, keepdims=keepdims, out=out))
 
 
 all.support_native_out = True
@@ -25,7 +25,7 @@ def any(
     keepdims: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return np.asarray(np.any(x, axis=axis, keepdims=keepdims, out=out))
+    return np.asanyarray(np.any(x, axis=axis, keepdims=keepdims, out=out))
 
 
 any.support_native_out = True
@@ -6,7 +6,7 @@ versions = {
 }
 
 # flake8: noqa
-import importlib
+import importlib.metadata
 
 from . import numpy
 from . import jax
@@ -20,14 +20,17 @@ def fn_name_from_version_specific_fn_name(name, version):
     Parameters
     ----------
     name
-        the version specific name of the function for which the version support is to be provided.
+        the version specific name of the function for which the version support is
+        to be provided.
     version
-        the version of the current framework for which the support is to be provided, the
-        version is inferred by importing the framework in the case of frontend version support
-        and defaults to the highest available version in case of import failure
+        the version of the current framework for which the support is to be
+        provided, the version is read from the installed package metadata in the
+        case of frontend version support and defaults to the highest available
+        version if the framework is not installed
     Returns
     -------
-        the name of the original function which will then point to the version specific function
+        the name of the original function which will then point to the version
+        specific function
 
     """
     version = str(version)
@@ -76,12 +79,12 @@ def set_frontend_to_specific_version(frontend):
         to make the original function name to point to the version specific one
     """
     f = str(frontend.__name__)
-    f = f[f.index("frontends") + 10 :]
-    str_f = str(f)
+    str_f = f[f.index("frontends") + 10 :]
+    # the version is read from the package metadata, so that the framework itself
+    # is only imported once it is actually used
     try:
-        f = importlib.import_module(f)
-        f_version = f.__version__
-    except (ImportError, AttributeError):
+        f_version = importlib.metadata.version(str_f)
+    except importlib.metadata.PackageNotFoundError:
         f_version = versions[str_f]
 
     for i in list(frontend.__dict__):
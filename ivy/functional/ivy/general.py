@@ -23,6 +23,7 @@ from ivy.func_wrapper import (
     handle_out_argument,
     handle_nestable,
     handle_array_like_without_promotion,
+    _refresh_compiled_modes,
 )
 from ivy.functional.ivy.device import dev
 
@@ -276,6 +277,7 @@ def set_array_mode(mode: bool) -> None:
     global array_mode_stack
     ivy.assertions.check_isinstance(mode, bool)
     array_mode_stack.append(mode)
+    _refresh_compiled_modes()
 
 
 @handle_exceptions
@@ -296,6 +298,7 @@ def unset_array_mode() -> None:
     global array_mode_stack
     if array_mode_stack:
         array_mode_stack.pop(-1)
+    _refresh_compiled_modes()
 
 
 @handle_exceptions
@@ -339,6 +342,7 @@ def set_nestable_mode(mode: bool) -> None:
     global nestable_mode_stack
     ivy.assertions.check_isinstance(mode, bool)
     nestable_mode_stack.append(mode)
+    _refresh_compiled_modes()
 
 
 @handle_exceptions
@@ -359,6 +363,7 @@ def unset_nestable_mode() -> None:
     global nestable_mode_stack
     if nestable_mode_stack:
         nestable_mode_stack.pop(-1)
+    _refresh_compiled_modes()
 
 
 @handle_exceptions
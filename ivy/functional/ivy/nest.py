@@ -4,6 +4,7 @@
 from builtins import map as _map
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 import copy
+import functools
 from collections import UserDict
 
 # local
@@ -688,6 +689,22 @@ def nested_argwhere(
     """
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
+    if (
+        _base
+        and not check_nests
+        and stop_after_n_found is None
+        and not extra_nest_types
+    ):
+        # only the leaves are checked, so they are checked from the flat nest
+        leaves = []
+        spec = _tree_flatten(
+            nest, leaves, (True, True, True), to_ignore, (dict, UserDict)
+        )
+        if spec is None:
+            return [[]] if fn(nest) else False
+        return [
+            list(index) for index, leaf in zip(_tree_paths(spec), leaves) if fn(leaf)
+        ]
     _index = list() if _index is None else _index
     if (
         isinstance(nest, (tuple, list)) or isinstance(nest, extra_nest_types)
@@ -957,6 +974,202 @@ def map(
     return rets
 
 
+# Trees #
+# ------#
+
+_TUPLE, _NAMEDTUPLE, _LIST, _DICT = range(4)
+
+
+class TreeDef:
+    """The structure of a nest, as returned by :func:`ivy.tree_flatten`.
+
+    Treedefs of nests with the same structure are equal and have the same hash, so they
+    can be used as keys for caching anything which only depends on the structure of a
+    nest, such as the indices of its leaves.
+    """
+
+    __slots__ = ("_spec", "num_leaves", "_hash")
+
+    def __init__(self, spec, num_leaves):
+        self._spec = spec
+        self.num_leaves = num_leaves
+        self._hash = None
+
+    def __eq__(self, other):
+        return isinstance(other, TreeDef) and self._spec == other._spec
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._spec)
+        return self._hash
+
+    def __repr__(self):
+        return "TreeDef({})".format(_tree_repr(self._spec))
+
+    @property
+    def paths(self) -> Tuple[Tuple]:
+        """The index of each leaf within the nest, in the order of the leaves."""
+        return _tree_paths(self._spec)
+
+
+def _derived_flags(include_derived):
+    if include_derived is True:
+        return True, True, True
+    if not include_derived:
+        return False, False, False
+    return tuple(bool(include_derived.get(t, False)) for t in (tuple, list, dict))
+
+
+def _tree_flatten(x, leaves, derived, to_ignore, dict_types=dict):
+    # appends the leaves of x to leaves, and returns the spec of its structure, which
+    # is None for a leaf, and a hashable (kind, class, keys, children) tuple otherwise
+    cls = type(x)
+    if cls is tuple or (derived[0] and isinstance(x, tuple)):
+        if not isinstance(x, to_ignore):
+            kind = _NAMEDTUPLE if hasattr(x, "_fields") else _TUPLE
+            children = tuple(
+                [_tree_flatten(v, leaves, derived, to_ignore, dict_types) for v in x]
+            )
+            return kind, cls, None, children
+    elif cls is list or (derived[1] and isinstance(x, list)):
+        if not isinstance(x, to_ignore):
+            children = tuple(
+                [_tree_flatten(v, leaves, derived, to_ignore, dict_types) for v in x]
+            )
+            return _LIST, cls, None, children
+    elif cls is dict or (derived[2] and isinstance(x, dict_types)):
+        if not isinstance(x, to_ignore):
+            children = tuple(
+                [
+                    _tree_flatten(v, leaves, derived, to_ignore, dict_types)
+                    for v in x.values()
+                ]
+            )
+            return _DICT, cls, tuple(x.keys()), children
+    leaves.append(x)
+    return None
+
+
+def _tree_unflatten(spec, leaves, to_mutable=False):
+    # leaves is an iterator, which the leaves are consumed from in order
+    if spec is None:
+        return next(leaves)
+    kind, cls, keys, children = spec
+    values = [_tree_unflatten(child, leaves, to_mutable) for child in children]
+    if kind == _LIST:
+        return cls(values)
+    if kind == _DICT:
+        values = dict(zip(keys, values))
+        return values if cls is dict else cls(**values)
+    if to_mutable:
+        return values
+    if kind == _NAMEDTUPLE:
+        return cls(**dict(zip(cls._fields, values)))
+    return cls(values)
+
+
+def _tree_leaf_paths(spec, prefix):
+    if spec is None:
+        return [prefix]
+    _, _, keys, children = spec
+    keys = range(len(children)) if keys is None else keys
+    return [
+        path
+        for key, child in zip(keys, children)
+        for path in _tree_leaf_paths(child, prefix + (key,))
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _tree_paths(spec):
+    return tuple(_tree_leaf_paths(spec, ()))
+
+
+def _tree_repr(spec):
+    if spec is None:
+        return "*"
+    kind, cls, keys, children = spec
+    children = [_tree_repr(child) for child in children]
+    if kind == _DICT:
+        children = ["{}: {}".format(repr(k), c) for k, c in zip(keys, children)]
+    return "{}({})".format(cls.__name__, ", ".join(children))
+
+
+@handle_exceptions
+def tree_flatten(
+    nest: Any,
+    /,
+    *,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, TreeDef]:
+    """Flattens a nest of tuples, lists and dicts into a list of its leaves, together
+    with a treedef of its structure, from which it can be rebuilt with
+    :func:`ivy.tree_unflatten`.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+    include_derived
+        Whether to also flatten classes derived from tuple, list and dict.
+        Default is ``False``.
+    to_ignore
+        Types to treat as leaves, even when they are tuples, lists or dicts.
+
+    Returns
+    -------
+    ret
+        The leaves of the nest in depth-first order, and the treedef of the nest.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({'a': [1, 2], 'b': (3, {'c': 4})})
+    >>> print(leaves)
+    [1, 2, 3, 4]
+    >>> print(treedef)
+    TreeDef(dict('a': list(*, *), 'b': tuple(*, dict('c': *))))
+    >>> print(treedef.paths)
+    (('a', 0), ('a', 1), ('b', 0), ('b', 1, 'c'))
+    """
+    leaves = []
+    spec = _tree_flatten(
+        nest, leaves, _derived_flags(include_derived), ivy.default(to_ignore, ())
+    )
+    return leaves, TreeDef(spec, len(leaves))
+
+
+@handle_exceptions
+def tree_unflatten(treedef: TreeDef, leaves: Iterable, /) -> Any:
+    """Builds a nest with the structure of a treedef from :func:`ivy.tree_flatten`,
+    holding the given leaves.
+
+    Parameters
+    ----------
+    treedef
+        The structure of the nest to build.
+    leaves
+        The leaves of the nest, in the order returned by :func:`ivy.tree_flatten`.
+
+    Returns
+    -------
+    ret
+        The nest holding the leaves.
+
+    Examples
+    --------
+    >>> leaves, treedef = ivy.tree_flatten({'a': [1, 2], 'b': (3, {'c': 4})})
+    >>> print(ivy.tree_unflatten(treedef, [x * 10 for x in leaves]))
+    {'a': [10, 20], 'b': (30, {'c': 40})}
+    """
+    leaves = list(leaves)
+    if len(leaves) != treedef.num_leaves:
+        raise ivy.exceptions.IvyException(
+            "expected {} leaves, but got {}".format(treedef.num_leaves, len(leaves))
+        )
+    return _tree_unflatten(treedef._spec, iter(leaves))
+
+
 @handle_exceptions
 def nested_map(
     x: Union[ivy.Array, ivy.NativeArray, Iterable],
@@ -1018,6 +1231,11 @@ def nested_map(
     """
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
+    if not shallow and not extra_nest_types and not ivy.exists(max_depth):
+        # nothing is updated inplace, so the nest is mapped through its flat leaves
+        leaves = []
+        spec = _tree_flatten(x, leaves, _derived_flags(include_derived), to_ignore)
+        return _tree_unflatten(spec, iter([fn(leaf) for leaf in leaves]), to_mutable)
     if include_derived is True:
         include_derived = {tuple: True, list: True, dict: True}
     elif not include_derived:
@@ -1,4 +1,7 @@
 # global
+import os
+import sys
+import subprocess
 from typing import get_type_hints
 
 
@@ -123,3 +126,55 @@ def add_array_specs():
     for k, v in ivy.__dict__.items():
         if callable(v) and k[0].islower():
             v.array_spec = fn_array_spec(v)
+
+
+def import_profile(module="ivy", /, *, top=None):
+    """Return the import time of `module` and of each of the submodules it imports,
+    measured with ``python -X importtime`` in a fresh interpreter, so that the
+    modules already imported in the current process do not hide their cost.
+
+    Parameters
+    ----------
+    module
+        name of the module to profile the import of. Default is ``"ivy"``.
+    top
+        number of the most expensive modules to return. All modules are returned
+        by default.
+
+    Returns
+    -------
+    ret
+        dict mapping each imported module name to a tuple of its own import time and
+        its cumulative import time in seconds, ordered from the most expensive
+        cumulative import time.
+
+    Examples
+    --------
+    >>> profile = ivy.import_profile(top=3)
+    >>> print(list(profile.keys()))
+    ['ivy', 'ivy.func_wrapper', 'ivy.functional']
+
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    ivy.assertions.check_equal(
+        result.returncode,
+        0,
+        message="importing {} failed:\n{}".format(module, result.stderr),
+    )
+    profile = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # header line
+            continue
+        profile[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    profile = sorted(profile.items(), key=lambda item: item[1][1], reverse=True)
+    return dict(profile[:top])
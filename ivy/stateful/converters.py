@@ -1,40 +1,10 @@
 """Converters from Native Modules to Ivy Modules"""
 # global
-from types import SimpleNamespace
 from typing import Optional, Dict, List
 import re
 import inspect
 from collections import OrderedDict
 
-try:
-    import haiku as hk
-    from haiku._src.data_structures import FlatMapping
-    import jax
-except ImportError:
-    hk = SimpleNamespace()
-    hk.Module = SimpleNamespace
-    hk.transform = SimpleNamespace
-    hk.get_parameter = SimpleNamespace
-    FlatMapping = SimpleNamespace
-    jax = SimpleNamespace()
-    jax.random = SimpleNamespace()
-    jax.random.PRNGKey = SimpleNamespace
-
-try:
-    import torch
-except ImportError:
-    torch = SimpleNamespace()
-    torch.nn = SimpleNamespace()
-    torch.nn.Parameter = SimpleNamespace
-    torch.nn.Module = SimpleNamespace
-
-try:
-    import tensorflow as tf
-except ImportError:
-    tf = SimpleNamespace()
-    tf.keras = SimpleNamespace()
-    tf.keras.Model = SimpleNamespace
-
 # local
 import ivy
 from ivy.functional.ivy.gradients import _is_variable
@@ -108,6 +78,8 @@ class ModuleConverters:
         ret
             The new trainable hk.Module instance.
         """
+        import haiku as hk
+
         ivy_module = self
 
         class MyHaikuModel(hk.Module):
@@ -146,6 +118,40 @@ class ModuleConverters:
         ret
             The new trainable tf.keras.Module instance.
         """
+        import tensorflow as tf
+
+        class MyTFModule(tf.keras.Model):
+            def __init__(self, ivy_module):
+                super(MyTFModule, self).__init__()
+                self._ivy_module = ivy_module
+                self._assign_variables()
+
+            def _assign_variables(self):
+                self._ivy_module.v.cont_map(
+                    lambda x, kc: self.add_weight(
+                        name=kc, shape=x.shape, dtype=x.dtype, trainable=True
+                    )
+                )
+                model_weights = list()
+                self._ivy_module.v.cont_map(
+                    lambda x, kc: model_weights.append(ivy.to_numpy(x))
+                )
+                self.set_weights(model_weights)
+                params = {
+                    re.sub(":\\d+", "", param.name): param for param in self.variables
+                }
+                self._ivy_module.v = self._ivy_module.v.cont_map(
+                    lambda x, kc: params[kc]
+                )
+
+            def call(self, *args, **kwargs):
+                a, kw = ivy.args_to_native(*args, **kwargs)
+                ret = self._ivy_module._forward(*a, **kw)
+                if isinstance(ret, tuple):
+                    return ivy.args_to_native(*ret)
+
+                return ivy.to_native(ret)
+
         return MyTFModule(self)
 
     def to_torch_module(self):
@@ -162,6 +168,31 @@ class ModuleConverters:
         ret
             The new trainable torch.nn.Module instance.
         """
+        import torch
+
+        class MyTorchModule(torch.nn.Module):
+            def __init__(self, ivy_module):
+                torch.nn.Module.__init__(self)
+                self._ivy_module = ivy_module
+                self._assign_variables()
+
+            def _assign_variables(self):
+                self._ivy_module.v.cont_map(
+                    lambda x, kc: self.register_parameter(
+                        name=kc, param=torch.nn.Parameter(ivy.to_native(x))
+                    )
+                )
+                self._ivy_module.v = self._ivy_module.v.cont_map(
+                    lambda x, kc: self._parameters[kc]
+                )
+
+            def forward(self, *args, **kwargs):
+                a, kw = ivy.args_to_native(*args, **kwargs)
+                ret = self._ivy_module._forward(*a, **kw)
+                if isinstance(ret, tuple):
+                    return ivy.args_to_native(*ret)
+                return ivy.to_native(ret)
+
         return MyTorchModule(self)
 
     @staticmethod
@@ -204,6 +235,10 @@ class ModuleConverters:
             The new trainable torch module instance.
 
         """
+        import haiku as hk
+        from haiku._src.data_structures import FlatMapping
+        import jax
+
         RNG = jax.random.PRNGKey(42)
 
         def _hk_flat_map_to_dict(hk_flat_map):
@@ -429,6 +464,7 @@ class ModuleConverters:
         ret
             The new trainable ivy.Module instance.
         """
+        import torch
 
         class TorchIvyModule(ivy.Module):
             def __init__(
@@ -517,54 +553,3 @@ class ModuleConverters:
             inplace_update=inplace_update,
             **i_kwargs,
         )
-
-
-class MyTorchModule(torch.nn.Module):
-    def __init__(self, ivy_module):
-        torch.nn.Module.__init__(self)
-        self._ivy_module = ivy_module
-        self._assign_variables()
-
-    def _assign_variables(self):
-        self._ivy_module.v.cont_map(
-            lambda x, kc: self.register_parameter(
-                name=kc, param=torch.nn.Parameter(ivy.to_native(x))
-            )
-        )
-        self._ivy_module.v = self._ivy_module.v.cont_map(
-            lambda x, kc: self._parameters[kc]
-        )
-
-    def forward(self, *args, **kwargs):
-        a, kw = ivy.args_to_native(*args, **kwargs)
-        ret = self._ivy_module._forward(*a, **kw)
-        if isinstance(ret, tuple):
-            return ivy.args_to_native(*ret)
-        return ivy.to_native(ret)
-
-
-class MyTFModule(tf.keras.Model):
-    def __init__(self, ivy_module):
-        super(MyTFModule, self).__init__()
-        self._ivy_module = ivy_module
-        self._assign_variables()
-
-    def _assign_variables(self):
-        self._ivy_module.v.cont_map(
-            lambda x, kc: self.add_weight(
-                name=kc, shape=x.shape, dtype=x.dtype, trainable=True
-            )
-        )
-        model_weights = list()
-        self._ivy_module.v.cont_map(lambda x, kc: model_weights.append(ivy.to_numpy(x)))
-        self.set_weights(model_weights)
-        params = {re.sub(":\\d+", "", param.name): param for param in self.variables}
-        self._ivy_module.v = self._ivy_module.v.cont_map(lambda x, kc: params[kc])
-
-    def call(self, *args, **kwargs):
-        a, kw = ivy.args_to_native(*args, **kwargs)
-        ret = self._ivy_module._forward(*a, **kw)
-        if isinstance(ret, tuple):
-            return ivy.args_to_native(*ret)
-
-        return ivy.to_native(ret)
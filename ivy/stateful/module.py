@@ -18,6 +18,9 @@ from ivy.stateful.converters import ModuleConverters
 class Module(ModuleConverters, ModuleHelpers):
     """Module is a base class for deriving trainable modules."""
 
+    # number of forward passes currently running with submodule tracking enabled
+    _num_tracking_calls = 0
+
     def __init__(
         self,
         /,
@@ -105,14 +108,10 @@ class Module(ModuleConverters, ModuleHelpers):
         self._submod_depth = None
         self._submods_to_track = None
         self._track_submod_call_order = False
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        self._submod_rets = None
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        self._submod_call_order = None
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
@@ -372,6 +371,8 @@ class Module(ModuleConverters, ModuleHelpers):
         ret
             Result of the forward pass of the layer.
         """
+        if not Module._num_tracking_calls:
+            return self._forward(*args, **kwargs)
         if self.track_submod_call_order():
             self._add_submod_enter()
         ret = self._forward(*args, **kwargs)
@@ -475,12 +476,18 @@ class Module(ModuleConverters, ModuleHelpers):
         ret
         """
         with_grads = ivy.with_grads(with_grads=with_grads)
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        # the tracking containers are only created once they are accessed
+        self._submod_rets = None
+        self._submod_call_order = None
+        if not (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(expected_submod_rets)
+        ):
+            # inference path, without any of the tracking bookkeeping
+            if v is not None:
+                v = ivy.to_native(v)
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -491,8 +498,12 @@ class Module(ModuleConverters, ModuleHelpers):
 
         # convert variables to native arrays so that they can be tracked
         v = ivy.to_native(v)
-        ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
-        self._unset_submod_flags()
+        Module._num_tracking_calls += 1
+        try:
+            ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        finally:
+            Module._num_tracking_calls -= 1
+            self._unset_submod_flags()
         return ret
 
     def save_weights(self, weights_path, /):
@@ -622,3 +633,27 @@ class Module(ModuleConverters, ModuleHelpers):
     @property
     def built_(self):
         return self._built
+
+    @property
+    def submod_rets(self):
+        if self._submod_rets is None:
+            self._submod_rets = ivy.Container(
+                alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+            )
+        return self._submod_rets
+
+    @submod_rets.setter
+    def submod_rets(self, submod_rets):
+        self._submod_rets = submod_rets
+
+    @property
+    def submod_call_order(self):
+        if self._submod_call_order is None:
+            self._submod_call_order = ivy.Container(
+                alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+            )
+        return self._submod_call_order
+
+    @submod_call_order.setter
+    def submod_call_order(self, submod_call_order):
+        self._submod_call_order = submod_call_order
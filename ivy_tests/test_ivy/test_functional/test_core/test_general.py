@@ -699,6 +699,52 @@ def test_scatter_nd(
     )
 
 
+def _scatter_rows_expected(target, indices, updates, reduction, accumulate):
+    # reduces the updates of each row in turn, leaving rows without updates unchanged
+    ufunc = {"sum": np.add, "min": np.minimum, "max": np.maximum}[reduction]
+    expected = target.copy() if accumulate else np.zeros_like(target)
+    for row in range(len(target)):
+        row_updates = updates[indices % len(target) == row]
+        if len(row_updates):
+            reduced = ufunc.reduce(row_updates, axis=0)
+            expected[row] = ufunc(expected[row], reduced) if accumulate else reduced
+    return expected
+
+
+@pytest.mark.parametrize("reduction", ["sum", "min", "max"])
+@pytest.mark.parametrize("dtype", ["float32", "int32"])
+@pytest.mark.parametrize("sort_indices", [True, False])
+@pytest.mark.parametrize("with_out", [True, False])
+def test_scatter_duplicate_indices(reduction, dtype, sort_indices, with_out):
+    indices = np.random.randint(-6, 6, (50,))
+    if sort_indices:
+        indices = np.sort(indices % 6)
+    updates = np.random.randint(-(10**6), 10**6, (50, 3)).astype(dtype)
+    target = np.random.randint(-(10**6), 10**6, (6, 3)).astype(dtype)
+
+    # scatter_nd reduces into out
+    expected = _scatter_rows_expected(target, indices, updates, reduction, with_out)
+    out = ivy.array(target) if with_out else None
+    ret = ivy.scatter_nd(
+        ivy.array(indices[:, None]),
+        ivy.array(updates),
+        (6, 3),
+        reduction=reduction,
+        out=out,
+    )
+    assert np.allclose(ivy.to_numpy(ret), expected)
+    if with_out:
+        assert np.allclose(ivy.to_numpy(out), expected)
+
+    ret = ivy.scatter_flat(
+        ivy.array(indices), ivy.array(updates[:, 0]), size=6, reduction=reduction
+    )
+    expected = _scatter_rows_expected(
+        target[:, 0], indices, updates[:, 0], reduction, False
+    )
+    assert np.allclose(ivy.to_numpy(ret), expected)
+
+
 # gather
 @handle_test(
     fn_tree="functional.ivy.gather",
@@ -2125,3 +2171,47 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont):
         pass
     else:
         assert False, "One of the results is None while other isn't"
+
+
+def _fn4(x, w):
+    h = ivy.tanh(ivy.matmul(x, w) + 1.0)
+    return ivy.mean(h, axis=-1), ivy.sum(h**2, axis=0)
+
+
+def _fn5(x, w):
+    return ivy.concat([ivy.softmax(x[0:2], axis=-1), ivy.expand_dims(w[0], axis=0)])
+
+
+def _fn6(x, w):
+    # data dependent control flow, which has to be mapped in a loop
+    return x if ivy.sum(x) > 0 else -x
+
+
+@pytest.mark.parametrize("func", [_fn4, _fn5, _fn6])
+@pytest.mark.parametrize("in_axes", [(0, None), (1, None), (0, 0)])
+@pytest.mark.parametrize("out_axes", [0, 1])
+def test_vmap_matches_loop(func, in_axes, out_axes):
+    x = np.random.uniform(-1, 1, (4, 6, 3)).astype("float32")
+    w = np.random.uniform(-1, 1, (3, 3)).astype("float32")
+    if in_axes == (0, 0):
+        w = np.broadcast_to(w, (4, 3, 3)).copy()
+    args = [ivy.native_array(x), ivy.native_array(w)]
+
+    expected = []
+    for i in range(x.shape[in_axes[0]]):
+        example_args = [
+            ivy.native_array(np.take(arg, i, axis)) if axis is not None else arg
+            for arg, axis in zip([x, w], in_axes)
+        ]
+        ret = func(*example_args)
+        expected.append(ret if isinstance(ret, tuple) else (ret,))
+
+    # the second call reuses the batching decision for the same signature
+    vmapped_func = ivy.vmap(func, in_axes=in_axes, out_axes=out_axes)
+    for _ in range(2):
+        ret = vmapped_func(*args)
+        ret = ret if isinstance(ret, tuple) else (ret,)
+        assert len(ret) == len(expected[0])
+        for i, r in enumerate(ret):
+            expected_r = np.stack([ivy.to_numpy(e[i]) for e in expected], out_axes)
+            assert np.allclose(ivy.to_numpy(r), expected_r, rtol=1e-5, atol=1e-5)
@@ -3,6 +3,7 @@
 # global
 import copy
 import warnings
+from collections import namedtuple
 import pytest
 import numpy as np
 
@@ -442,6 +443,38 @@ def test_nested_map_w_extra_nest_types(fn):
     assert ivy.all(x_copy["b"]["c"] == x["b"]["c"])
 
 
+# tree_flatten
+@pytest.mark.parametrize(
+    "nest",
+    [
+        {"a": [[0, 1], [2, 3]], "b": {"c": ([0], 1)}},
+        [namedtuple("Point", ["x", "y"])(1, [2, 3]), (), {}],
+        4,
+    ],
+)
+def test_tree_flatten(nest):
+    leaves, treedef = ivy.tree_flatten(nest)
+    assert leaves == ivy.multi_index_nest(nest, treedef.paths)
+    assert treedef.num_leaves == len(leaves)
+    assert ivy.tree_unflatten(treedef, leaves) == nest
+    assert ivy.tree_unflatten(treedef, [x * 2 for x in leaves]) == ivy.nested_map(
+        nest, lambda x: x * 2, shallow=False
+    )
+
+
+# tree_flatten_treedef
+def test_tree_flatten_treedef():
+    _, treedef = ivy.tree_flatten({"a": [0, 1], "b": (2,)})
+    _, same_treedef = ivy.tree_flatten({"a": [ivy.array([0]), None], "b": ("2",)})
+    _, other_treedef = ivy.tree_flatten({"a": [0, 1], "b": [2]})
+    assert treedef == same_treedef
+    assert hash(treedef) == hash(same_treedef)
+    assert treedef != other_treedef
+    assert len({treedef, same_treedef, other_treedef}) == 2
+    with pytest.raises(ivy.exceptions.IvyException):
+        ivy.tree_unflatten(treedef, [0, 1])
+
+
 # nested_any
 @pytest.mark.parametrize("x", [{"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}])
 @pytest.mark.parametrize("fn", [lambda x: True if x % 2 == 0 else False])
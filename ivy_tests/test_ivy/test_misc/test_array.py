@@ -1,11 +1,14 @@
 # global
 from hypothesis import assume, strategies as st
 import numpy as np
+import pickle
+import pytest
 
 # local
 import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method, handle_test
+from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
 from ivy_tests.test_ivy.test_functional.test_core.test_elementwise import (
     not_too_close_to_zero,
     pow_helper,
@@ -2046,3 +2049,57 @@ def test_array__iter__(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+def test_array_lazy_metadata():
+    ivy.clear_backend_stack()
+    x = ivy.Array(np.ones((2, 3), dtype=np.float32))
+    # only the shape is computed on construction
+    assert x._dtype is None and x._device is None and x._size is None
+    assert x.backend == ""
+    ivy.set_backend("numpy")
+    try:
+        assert x.dtype == "float32"
+        assert x.device == "cpu"
+        assert x.size == 6
+        assert x._dtype is not None and x._size is not None
+        # setting the data invalidates the cached metadata
+        x.data = np.zeros((4,), dtype=np.int64)
+        assert x._dtype is None and x._size is None
+        assert x.dtype == "int64"
+        assert x.size == 4
+        assert x.shape == (4,)
+        assert x.backend == "numpy"
+    finally:
+        ivy.unset_backend()
+
+
+def test_array_lazy_metadata_backend_switch():
+    frameworks = available_frameworks()
+    if len(frameworks) < 2:
+        pytest.skip("requires a second backend")
+    ivy.clear_backend_stack()
+    x = ivy.Array(np.ones((2,), dtype=np.float32))
+    # the metadata is computed by the backend of the native array, not by the
+    # backend which is set by the time of the first access
+    ivy.set_backend([fw for fw in frameworks if fw != "numpy"][0])
+    try:
+        assert x.dtype == "float32"
+        assert x.device == "cpu"
+        assert x.size == 2
+    finally:
+        ivy.unset_backend()
+
+
+def test_array_pickle_slots():
+    ivy.set_backend("numpy")
+    try:
+        x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+        y = pickle.loads(pickle.dumps(x))
+        for attr in Array.__slots__:
+            assert hasattr(y, attr)
+        assert y.backend == "numpy"
+        assert y.dtype == x.dtype and y.shape == x.shape and y.size == x.size
+        assert np.array_equal(ivy.to_numpy(y), ivy.to_numpy(x))
+    finally:
+        ivy.unset_backend()
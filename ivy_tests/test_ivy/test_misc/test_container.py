@@ -2128,6 +2128,78 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_multi_map_in_function(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([3.0, 4.0], device=on_device)},
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([5.0, 6.0], device=on_device),
+            "b": {"c": ivy.array([7.0, 8.0], device=on_device)},
+        }
+    )
+
+    def fn(x, ys, scale=1.0, axes=None):
+        assert isinstance(ys, tuple) and isinstance(axes, tuple)
+        return (x + ys[0] + ys[1]) * scale
+
+    # containers nested within args and kwargs are substituted leaf by leaf
+    container_mapped = ivy.Container.cont_multi_map_in_function(
+        fn, container0, (container1, 1.0), scale=container1, axes=(0,)
+    )
+    assert np.allclose(ivy.to_numpy(container_mapped.a), np.array([35.0, 54.0]))
+    assert np.allclose(ivy.to_numpy(container_mapped.b.c), np.array([77.0, 104.0]))
+
+    # with out
+    out = Container(
+        {
+            "a": ivy.zeros((2,), device=on_device),
+            "b": {"c": ivy.zeros((2,), device=on_device)},
+        }
+    )
+    ret = ivy.Container.cont_multi_map_in_function(
+        "add", container0, container1, out=out
+    )
+    assert ret is out
+    assert np.allclose(ivy.to_numpy(out.a), np.array([6.0, 8.0]))
+    assert np.allclose(ivy.to_numpy(out.b.c), np.array([10.0, 12.0]))
+
+
+def test_container_lazy(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0, 4.0], device=on_device),
+            "b": {"c": ivy.array([9.0], device=on_device)},
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([2.0, 0.0], device=on_device),
+            "b": {"c": ivy.array([0.0], device=on_device)},
+        }
+    )
+    lazy0 = container0.cont_lazy()
+    lazy = ((lazy0 * lazy0 + container1) / 2 - lazy0).maximum(1.0).sqrt()
+    assert isinstance(lazy, ivy.LazyContainer)
+    container_lazy = lazy.materialize()
+    container_eager = (
+        ((container0 * container0 + container1) / 2 - container0).maximum(1.0).sqrt()
+    )
+    assert isinstance(container_lazy, ivy.Container)
+    assert ivy.Container.cont_identical_structure([container_lazy, container_eager])
+    assert np.allclose(ivy.to_numpy(container_lazy.a), ivy.to_numpy(container_eager.a))
+    assert np.allclose(
+        ivy.to_numpy(container_lazy.b.c), ivy.to_numpy(container_eager.b.c)
+    )
+    # reflected operators, and recording leaves the inputs untouched
+    container_lazy = (1 - 2 * lazy0).materialize()
+    assert np.allclose(ivy.to_numpy(container_lazy.a), np.array([-1.0, -7.0]))
+    assert np.allclose(ivy.to_numpy(container0.a), np.array([1.0, 4.0]))
+
+
 def test_container_common_key_chains(on_device):
     arr1 = ivy.array([1], device=on_device)
     arr2 = ivy.array([2], device=on_device)
@@ -2546,6 +2618,94 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_memory_map(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    h5py = pytest.importorskip("h5py")
+    save_filepath = "container_on_disk.hdf5"
+    data = np.arange(12, dtype=np.float32).reshape(6, 2)
+    with h5py.File(save_filepath, "w") as h5_obj:
+        # contiguous dataset, which can be memory-mapped
+        h5_obj.create_dataset("a", data=data)
+        # chunked dataset, which is read directly instead
+        h5_obj.create_group("b").create_dataset(
+            "c", data=data[:, 0], chunks=(2,), maxshape=(None,)
+        )
+
+    for memory_map in [False, True]:
+        loaded_container = Container.cont_from_disk_as_hdf5(
+            save_filepath, slice(1, 5, 2), memory_map=memory_map
+        )
+        assert np.array_equal(ivy.to_numpy(loaded_container.a), data[1:5:2])
+        assert np.array_equal(ivy.to_numpy(loaded_container.b.c), data[1:5:2, 0])
+        if ivy.current_backend_str() == "numpy":
+            assert isinstance(ivy.to_native(loaded_container.a), np.memmap) is (
+                memory_map
+            )
+            assert not isinstance(ivy.to_native(loaded_container.b.c), np.memmap)
+
+    # empty slice
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, slice(0))
+    assert ivy.to_numpy(loaded_container.a).shape == (0, 2)
+
+    os.remove(save_filepath)
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_container_hdf5_writer(background, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    h5py = pytest.importorskip("h5py")
+    save_filepath = "container_on_disk.hdf5"
+
+    # streaming writes, with per key chain chunks and compression
+    with Container.cont_hdf5_writer(
+        save_filepath,
+        mode="w",
+        chunks={"a": (2, 3)},
+        compression={"b/c": "gzip"},
+        background=background,
+    ) as writer:
+        for i in range(3):
+            writer.append(
+                Container(
+                    {
+                        "a": ivy.full(
+                            (2, 3), float(i), dtype="float32", device=on_device
+                        ),
+                        "b": {
+                            "c": ivy.full((2,), i, dtype="int32", device=on_device)
+                        },
+                    }
+                )
+            )
+        writer.flush()
+        assert writer.batch_size == 6
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["a"].chunks == (2, 3)
+        assert h5_obj["a"].compression is None
+        assert h5_obj["b/c"].compression == "gzip"
+
+    # appending a single container grows the datasets
+    container = Container(
+        {
+            "a": ivy.full((1, 3), 9.0, dtype="float32", device=on_device),
+            "b": {"c": ivy.full((1,), 9, dtype="int32", device=on_device)},
+        }
+    )
+    assert container.cont_append_to_disk_as_hdf5(save_filepath) == 7
+
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    expected = np.array([0, 0, 1, 1, 2, 2, 9])
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), np.tile(expected, (3, 1)).T)
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), expected)
+    assert Container.h5_file_size(save_filepath) == (7 * 4 * 4, 7)
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2585,6 +2745,57 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("mode", ["in_place", "out", "virtual"])
+def test_container_shuffle_h5_file_in_blocks(mode, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    out_filepath = "container_on_disk_shuffled.hdf5"
+    data = np.arange(14, dtype=np.int32).reshape(7, 2)
+    container = Container(
+        {
+            "a": ivy.array(data, device=on_device),
+            "b": {"c": ivy.array(data[:, 0], device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # blocks smaller than the datasets
+    Container.shuffle_h5_file(
+        save_filepath,
+        seed_value=1,
+        block_size=2,
+        out=out_filepath if mode == "out" else None,
+        virtual=mode == "virtual",
+    )
+    loaded_filepath = out_filepath if mode == "out" else save_filepath
+    container_shuffled = Container.cont_from_disk_as_hdf5(loaded_filepath)
+    assert Container.h5_file_size(loaded_filepath) == (7 * 3 * 4, 7)
+
+    permutation = list(range(7))
+    random.seed(1)
+    random.shuffle(permutation)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), data[permutation])
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c), data[permutation, 0])
+
+    # sliced loading applies the same permutation
+    container_sliced = Container.cont_from_disk_as_hdf5(loaded_filepath, slice(2, 5))
+    assert np.array_equal(ivy.to_numpy(container_sliced.a), data[permutation][2:5])
+
+    # shuffling again in place keeps all datasets aligned
+    Container.shuffle_h5_file(loaded_filepath, seed_value=2, block_size=3)
+    container_shuffled = Container.cont_from_disk_as_hdf5(loaded_filepath)
+    assert np.array_equal(
+        ivy.to_numpy(container_shuffled.a)[:, 0], ivy.to_numpy(container_shuffled.b.c)
+    )
+    assert sorted(ivy.to_numpy(container_shuffled.b.c)) == list(data[:, 0])
+
+    os.remove(save_filepath)
+    if mode == "out":
+        os.remove(out_filepath)
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
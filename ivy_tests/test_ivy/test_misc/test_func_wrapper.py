@@ -88,3 +88,91 @@ def test_integer_arrays_to_float(x, expected):
     expected = ivy.array(expected)
 
     assert ivy.array_equal(ivy.func_wrapper.integer_arrays_to_float(_fn1)(x), expected)
+
+
+def test_compiled_wrapped_function():
+    fn = ivy.current_backend().add
+    decorators = [
+        "outputs_to_ivy_arrays",
+        "inputs_to_native_arrays",
+        "handle_out_argument",
+        "handle_nestable",
+        "handle_exceptions",
+    ]
+    compiled = ivy.func_wrapper._compile_wrapped_function(fn, decorators)
+    assert all(hasattr(compiled, attr) for attr in decorators)
+    x = ivy.array([1.0, 2.0])
+    assert isinstance(compiled(x, x), ivy.Array)
+    assert ivy.array_equal(compiled(x, x), ivy.array([2.0, 4.0]))
+    # container inputs are mapped to the leaves
+    ret = compiled(ivy.Container(a=x), x)
+    assert ivy.is_ivy_container(ret)
+    assert ivy.array_equal(ret.a, ivy.array([2.0, 4.0]))
+    # inplace update via out
+    out = ivy.zeros(2)
+    assert compiled(x, x, out=out) is out
+    assert ivy.array_equal(out, ivy.array([2.0, 4.0]))
+    # the compiled modes follow the array mode stack
+    ivy.set_array_mode(False)
+    assert not isinstance(compiled(x.data, x.data), ivy.Array)
+    ivy.unset_array_mode()
+    assert isinstance(compiled(x, x), ivy.Array)
+
+
+def test_compiled_wrapped_function_excludes_mixed():
+    # the input conversions of mixed functions only have an order when stacked
+    assert not ivy.func_wrapper._is_compilable(
+        ["inputs_to_native_arrays", "inputs_to_ivy_arrays", "handle_nestable"]
+    )
+    assert ivy.func_wrapper._is_compilable(["inputs_to_native_arrays"])
+    assert not ivy.func_wrapper._is_compilable([])
+
+
+def test_compiled_compositional_function():
+    # flatten stacks handle_out_argument outside of handle_nestable, so it is not
+    # in the order of FN_DECORATORS and stays stacked
+    original = ivy.backend_handler.ivy_original_dict["flatten"]
+    assert ivy.func_wrapper._get_decorator_chain(original) is None
+    assert (
+        ivy.func_wrapper._wrap_function("flatten", original, original, True)
+        is original
+    )
+    original = ivy.backend_handler.ivy_original_dict["native_array"]
+    fn, decorators = ivy.func_wrapper._get_decorator_chain(original)
+    assert decorators == ["handle_exceptions"]
+    assert not hasattr(fn, "__wrapped__")
+    compiled = ivy.func_wrapper._wrap_function(
+        "native_array", original, original, compositional=True
+    )
+    assert compiled is not original
+    assert compiled.handle_exceptions
+    assert ivy.is_native_array(compiled([1.0, 2.0]))
+
+
+def _fn8(x: Union[ivy.Array, ivy.NativeArray], y: int, z: ivy.Array, /, *, out=None):
+    return x, z
+
+
+def _fn9(equation: str, *operands: Union[ivy.Array, ivy.NativeArray]):
+    return operands
+
+
+def test_get_array_like_indices():
+    assert ivy.func_wrapper._get_array_like_indices(_fn8) == ((0, 2), None)
+    assert ivy.func_wrapper._get_array_like_indices(_fn3) == ((), None)
+    assert ivy.func_wrapper._get_array_like_indices(_fn9) == ((), 1)
+    x, z = handle_array_like_without_promotion(_fn8)([1], 2, [3])
+    assert isinstance(x, ivy.Array) and isinstance(z, ivy.Array)
+    # every array-like *args argument is converted
+    operands = handle_array_like_without_promotion(_fn9)("ij,jk", [[1]], [[2]])
+    assert all(isinstance(operand, ivy.Array) for operand in operands)
+
+
+def test_get_first_array():
+    x, y = ivy.array([1.0]), ivy.array([2])
+    # the first array is found beyond the first child at each level of the nest
+    assert ivy.func_wrapper._get_first_array([1, (2, [x])], y) is x
+    assert ivy.func_wrapper._get_first_array(1, a={"b": [2, {"c": (3, y)}]}) is y
+    assert ivy.func_wrapper._get_first_array([1, {"a": 2}], b=(x,)) is x
+    assert ivy.func_wrapper._get_first_array(ivy.Container(a=1, b=y)) is y
+    assert ivy.func_wrapper._get_first_array([1, [2]], a={"b": 3}) is None
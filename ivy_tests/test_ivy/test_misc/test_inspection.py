@@ -38,3 +38,17 @@ def _fn2(
 def test_fn_array_spec(fn_n_spec):
     fn, spec = fn_n_spec
     assert ivy.fn_array_spec(fn) == spec
+
+
+def test_import_profile():
+    profile = ivy.import_profile("ivy")
+    assert "ivy" in profile
+    assert "ivy.func_wrapper" in profile
+    # frameworks are only imported once their backend is used
+    for framework in ["torch", "tensorflow", "jax"]:
+        assert framework not in profile
+    cumulative_times = [cumulative for _, cumulative in profile.values()]
+    assert cumulative_times == sorted(cumulative_times, reverse=True)
+    own_time, cumulative_time = profile["ivy"]
+    assert 0 <= own_time <= cumulative_time
+    assert len(ivy.import_profile("ivy", top=3)) == 3
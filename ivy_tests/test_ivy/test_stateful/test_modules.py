@@ -1010,3 +1010,58 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v.cont_flatten_key_chains().to_numpy(),
         ]
     )
+
+
+class _VRecordingModule(TrainableModule):
+    def _forward(self, x):
+        self.v_in_forward = self.v
+        return TrainableModule._forward(self, x)
+
+
+def test_module_tracking_containers_created_on_demand():
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 3), "float32")
+    module = TrainableModule(3, 2, hidden_size=4)
+
+    # no tracking containers are created by a plain forward pass
+    module(x)
+    assert module._submod_rets is None
+    assert module._submod_call_order is None
+    assert isinstance(module.submod_rets, ivy.Container)
+    assert not module.submod_rets
+
+    # tracking fills them, and the next plain forward pass resets them
+    module(x, track_submod_rets=True)
+    assert module.submod_rets
+    module(x)
+    assert module._submod_rets is None
+    assert not module.submod_rets
+
+
+def test_module_v_converted_to_native():
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 3), "float32")
+    module = _VRecordingModule(3, 2, hidden_size=4)
+    v = module.v.cont_map(lambda x_, kc: ivy.array(x_))
+    module(x, v=v)
+    leaves = list(module.v_in_forward.cont_to_iterator_values())
+    assert leaves
+    assert all(ivy.is_native_array(leaf) for leaf in leaves)
+
+
+def test_module_tracking_flags_unset_on_error():
+    x = ivy.astype(ivy.linspace(ivy.zeros((2,)), ivy.ones((2,)), 3), "float32")
+    module = TrainableModule(3, 2, hidden_size=4)
+    module(x, track_submod_rets=True)
+    expected_submod_rets = module.submod_rets.cont_map(
+        lambda rets, kc: [ret + 1.0 for ret in rets]
+    )
+    try:
+        module(x, expected_submod_rets=expected_submod_rets)
+        raise AssertionError("forward pass succeeded despite wrong expected returns")
+    except ivy.exceptions.IvyException:
+        pass
+    assert ivy.Module._num_tracking_calls == 0
+    assert not module._track_submod_rets
+    assert module.expected_submod_rets is None
+    # the next forward pass is untracked again
+    module(x)
+    assert module._submod_rets is None